@@ -4,30 +4,126 @@ import subprocess
 import sys
 import argparse
 import os
-
-# Fix Unicode encoding for Windows console
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-
-# Set Docker Compose project name for consistent container naming in Docker Desktop
-os.environ["COMPOSE_PROJECT_NAME"] = "whisper-ui"
-
-
-def run_command(cmd, description):
-    """Run a shell command and handle errors"""
+import selectors
+import shlex
+import threading
+from pathlib import Path
+
+# Add project root to path (scripts/docker/ -> scripts/ -> project root)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.docker.common import run_or_exec
+
+# Plain BuildKit progress output so concurrent builds stay readable
+# (common enables BuildKit itself)
+os.environ.setdefault("BUILDKIT_PROGRESS", "plain")
+
+
+def cache_args(image, no_cache):
+    """Build arguments that embed and reuse inline layer cache for an image"""
+    args = ["--build-arg", "BUILDKIT_INLINE_CACHE=1"]
+    if not no_cache:
+        args.extend(["--cache-from", f"{image}:latest"])
+    return args
+
+
+def _stream_output(proc, prefix):
+    """Copy a child process's output to stdout line by line (Windows fallback)"""
+    for line in iter(proc.stdout.readline, b""):
+        sys.stdout.buffer.write(prefix + line)
+        sys.stdout.buffer.flush()
+
+
+def _relay_output(streams):
+    """
+    Multiplex children's output onto stdout with a selector (POSIX only).
+
+    Reads whatever is available from each non-blocking pipe in large chunks
+    and writes complete lines with their prefix in one call per chunk.
+
+    Args:
+        streams: List of (pipe, prefix) tuples
+    """
+    selector = selectors.DefaultSelector()
+    partial = {}
+    for pipe, prefix in streams:
+        fd = pipe.fileno()
+        os.set_blocking(fd, False)
+        selector.register(fd, selectors.EVENT_READ, prefix)
+        partial[fd] = b""
+
+    out = sys.stdout.buffer
+    while selector.get_map():
+        for key, _ in selector.select():
+            prefix = key.data
+            try:
+                data = os.read(key.fd, 65536)
+            except BlockingIOError:
+                continue
+            if not data:
+                selector.unregister(key.fd)
+                if partial[key.fd]:
+                    out.write(prefix + partial[key.fd] + b"\n")
+                continue
+            *lines, partial[key.fd] = (partial[key.fd] + data).split(b"\n")
+            if lines:
+                out.write(b"".join(prefix + line + b"\n" for line in lines))
+        out.flush()
+    selector.close()
+
+
+def run_parallel(jobs):
+    """Run independent build commands concurrently and handle errors
+
+    Args:
+        jobs: List of (cmd, description, prefix) tuples
+    """
     print(f"\n{'='*60}")
-    print(f"{description}")
+    for cmd, description, _ in jobs:
+        print(f"{description}")
+        print(f"  Command: {shlex.join(cmd)}")
     print(f"{'='*60}")
-    print(f"Command: {' '.join(cmd)}")
     print()
-
-    result = subprocess.run(cmd)
-
-    if result.returncode != 0:
-        print(f"\n❌ Error: {description} failed")
+    sys.stdout.flush()
+
+    procs = []
+    streams = []
+    for cmd, description, prefix in jobs:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0
+        )
+        procs.append((proc, description))
+        streams.append((proc.stdout, f"[{prefix}] ".encode()))
+
+    if sys.platform == 'win32':
+        # Selectors only support sockets on Windows; use a reader thread per pipe
+        threads = [
+            threading.Thread(target=_stream_output, args=(proc, prefix), daemon=True)
+            for (proc, _), (_, prefix) in zip(procs, streams)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    else:
+        _relay_output(streams)
+
+    failed = []
+    for proc, description in procs:
+        proc.wait()
+        if proc.returncode != 0:
+            failed.append(description)
+
+    if failed:
+        for description in failed:
+            print(f"\n❌ Error: {description} failed")
         sys.exit(1)
 
-    print(f"\n✅ Success: {description} completed")
+    for _, description in procs:
+        print(f"\n✅ Success: {description} completed")
 
 
 def main():
@@ -41,23 +137,40 @@ def main():
     # If no specific service selected, build both
     build_all = not (args.backend or args.frontend)
 
+    jobs = []
+
     # Build backend
     if args.backend or build_all:
         cmd = ["docker", "build", "-t", "whisper-backend"]
+        cmd.extend(cache_args("whisper-backend", args.no_cache))
         if args.no_cache:
             cmd.append("--no-cache")
         cmd.extend(["-f", "src/presentation/api/Dockerfile", "."])
 
-        run_command(cmd, "Building backend image")
+        jobs.append((cmd, "Building backend image", "backend"))
 
     # Build frontend
     if args.frontend or build_all:
         cmd = ["docker", "build", "-t", "whisper-frontend"]
+        cmd.extend(cache_args("whisper-frontend", args.no_cache))
         if args.no_cache:
             cmd.append("--no-cache")
         cmd.extend(["-f", "src/presentation/frontend/Dockerfile", "src/presentation/frontend"])
 
-        run_command(cmd, "Building frontend image")
+        jobs.append((cmd, "Building frontend image", "frontend"))
+
+    # Single image: nothing left to do afterwards, so hand the process to docker
+    if len(jobs) == 1:
+        cmd, description, _ = jobs[0]
+        print(f"\n{'='*60}")
+        print(f"{description}")
+        print(f"{'='*60}")
+        print(f"Command: {shlex.join(cmd)}")
+        print()
+        run_or_exec(cmd)
+
+    # Backend and frontend images share no build context, so build them concurrently
+    run_parallel(jobs)
 
     print("\n" + "="*60)
     print("✅ All requested images built successfully!")
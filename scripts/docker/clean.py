@@ -18,14 +18,21 @@ Usage:
 import subprocess
 import sys
 import argparse
-import os
+from pathlib import Path
 
-# Fix Unicode encoding for Windows console
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
+# Add project root to path (scripts/docker/ -> scripts/ -> project root)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Set Docker Compose project name for consistent container naming in Docker Desktop
-os.environ["COMPOSE_PROJECT_NAME"] = "whisper-ui"
+from scripts.docker.common import DOWN_ARGS, compose_base, run_or_exec
+
+# Locally built images (ngrok uses a Docker Hub image)
+IMAGES = ["whisper-backend", "whisper-frontend"]
+
+
+def remove_images():
+    """Force-remove project images in a single docker call, ignoring missing ones"""
+    subprocess.run(["docker", "image", "rm", "-f"] + IMAGES,
+                  stderr=subprocess.DEVNULL)
 
 
 def main():
@@ -37,8 +44,9 @@ def main():
 
     args = parser.parse_args()
 
-    # Env file for docker-compose
-    env_file = ["--env-file", "src/presentation/api/.env"]
+    # Compose command with env file and ngrok profile
+    compose = list(compose_base(ngrok=True))
+    down = list(DOWN_ARGS)
 
     if args.all:
         print("WARNING: This will remove all containers, images, and volumes!")
@@ -49,18 +57,16 @@ def main():
             sys.exit(0)
 
         # Stop and remove containers and volumes (include ngrok profile)
-        subprocess.run(["docker-compose"] + env_file + ["--profile", "ngrok", "down", "-v"])
+        subprocess.run(compose + down + ["-v"])
 
-        # Remove images (only backend/frontend, ngrok uses Docker Hub image)
-        subprocess.run(["docker", "rmi", "whisper-backend", "whisper-frontend"],
-                      stderr=subprocess.DEVNULL)
+        # Remove images (must wait for down so no container still holds them)
+        remove_images()
 
         print("[OK] Cleanup complete!")
 
     elif args.images:
         print("Removing Docker images...")
-        subprocess.run(["docker", "rmi", "whisper-backend", "whisper-frontend"],
-                      stderr=subprocess.DEVNULL)
+        remove_images()
         print("[OK] Images removed!")
 
     elif args.volumes:
@@ -70,13 +76,13 @@ def main():
             print("Cancelled.")
             sys.exit(0)
 
-        subprocess.run(["docker-compose"] + env_file + ["--profile", "ngrok", "down", "-v"])
-        print("[OK] Volumes removed!")
+        print("Removing containers and volumes...")
+        run_or_exec(compose + down + ["-v"])
 
     else:
         # Just stop and remove containers (default) - include ngrok profile
-        subprocess.run(["docker-compose"] + env_file + ["--profile", "ngrok", "down"])
-        print("[OK] Containers stopped and removed!")
+        print("Stopping and removing containers...")
+        run_or_exec(compose + down)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+"""Shared Docker Compose configuration and helpers for docker management scripts
+
+Importing this module also applies the environment every docker script needs:
+- UTF-8 console output on Windows
+- COMPOSE_PROJECT_NAME for consistent container naming in Docker Desktop
+- DOCKER_BUILDKIT / COMPOSE_DOCKER_CLI_BUILD so builds use BuildKit
+"""
+import asyncio
+import os
+import subprocess
+import sys
+from functools import lru_cache
+
+# Fix Unicode encoding for Windows console
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# Docker Compose project name for consistent container naming in Docker Desktop
+COMPOSE_PROJECT_NAME = "whisper-ui"
+os.environ["COMPOSE_PROJECT_NAME"] = COMPOSE_PROJECT_NAME
+
+# Build through BuildKit so the Dockerfiles' cache mounts are reused
+os.environ.setdefault("DOCKER_BUILDKIT", "1")
+os.environ.setdefault("COMPOSE_DOCKER_CLI_BUILD", "1")
+
+# Env file passed to docker-compose (relative to project root); compose parses
+# it with its own dotenv rules and then skips the project-root .env
+DEFAULT_ENV_FILE = "src/presentation/api/.env"
+
+# Valid service names (simple names as defined in docker-compose.yml)
+SERVICES = [
+    "postgres",
+    "backend",
+    "frontend",
+    "ngrok-backend",
+    "ngrok-frontend",
+    "ngrok-llm"
+]
+
+# Ngrok tunnel container names
+NGROK_CONTAINERS = [
+    "ngrok-whisper-backend",
+    "ngrok-whisper-frontend",
+    "ngrok-whisper-llm"
+]
+
+# Startup banners shared by run.py and rebuild.py
+NGROK_BANNER = """Starting all services including ngrok tunnels...
+  Backend tunnel:  https://anas-hammo-whisper-backend.ngrok.dev
+  Frontend tunnel: https://anas-hammo-whisper-frontend.ngrok.dev
+  LLM tunnel:      https://anas-hammo-whisper-llm.ngrok.dev
+
+Ngrok Web UI:
+  Backend:  http://localhost:4050
+  Frontend: http://localhost:4051
+  LLM:      http://localhost:4052
+"""
+
+CORE_BANNER = """Starting core services only (postgres, backend, frontend)...
+Use without --no-ngrok to include ngrok tunnels
+"""
+
+
+# Seconds containers get to stop gracefully on down (docker default is 10)
+STOP_TIMEOUT = 5
+
+# Teardown arguments: also remove containers of services no longer in the
+# compose file, and bound how long stopping may take
+DOWN_ARGS = ("down", "--remove-orphans", "-t", str(STOP_TIMEOUT))
+
+
+@lru_cache(maxsize=None)
+def compose_command() -> tuple:
+    """
+    Detect the Docker Compose CLI, preferring the V2 plugin (`docker compose`).
+
+    V2 stops and removes services concurrently; the standalone V1
+    `docker-compose` binary is used only when the plugin is unavailable.
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "compose", "version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if result.returncode == 0:
+            return ("docker", "compose")
+    except FileNotFoundError:
+        pass
+    return ("docker-compose",)
+
+
+@lru_cache(maxsize=None)
+def compose_base(ngrok: bool = True) -> tuple:
+    """
+    Build the Docker Compose command prefix with the env file.
+
+    Args:
+        ngrok: Include the ngrok profile
+
+    Returns:
+        Command prefix as a tuple (copy with list() before extending)
+    """
+    cmd = compose_command() + ("--env-file", DEFAULT_ENV_FILE)
+    if ngrok:
+        cmd += ("--profile", "ngrok")
+    return cmd
+
+
+def print_banner(no_ngrok):
+    """Print which services are starting and where to reach them"""
+    sys.stdout.write(CORE_BANNER if no_ngrok else NGROK_BANNER)
+    sys.stdout.flush()
+
+
+async def _run_alongside(cmd: list, callback) -> int:
+    """Start cmd, run callback while it executes, then wait for it"""
+    proc = await asyncio.create_subprocess_exec(*cmd)
+    callback()
+    return await proc.wait()
+
+
+def run_alongside(cmd: list, callback) -> int:
+    """
+    Run cmd and call callback (e.g. banner printing) while it starts up.
+
+    Returns:
+        Exit code of cmd
+    """
+    return asyncio.run(_run_alongside(cmd, callback))
+
+
+def run_or_exec(cmd: list) -> None:
+    """
+    Replace the current process with cmd, or run it and exit on Windows.
+
+    Only use as the final action of a script; this function never returns.
+    """
+    if sys.platform == 'win32':
+        # execvp is unreliable on Windows consoles. Ctrl+C reaches the child
+        # through the shared console, so keep waiting for it to shut down
+        # instead of exiting while compose is still stopping containers.
+        proc = subprocess.Popen(cmd)
+        try:
+            sys.exit(proc.wait())
+        except KeyboardInterrupt:
+            sys.exit(proc.wait())
+
+    sys.stdout.flush()
+    os.execvp(cmd[0], cmd)
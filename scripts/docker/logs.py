@@ -17,27 +17,14 @@ Usage:
     python scripts/docker/logs.py backend -f     # Follow backend logs
     python scripts/docker/logs.py --tail 100     # Show last 100 lines
 """
-import subprocess
 import sys
 import argparse
-import os
+from pathlib import Path
 
-# Fix Unicode encoding for Windows console
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
+# Add project root to path (scripts/docker/ -> scripts/ -> project root)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Set Docker Compose project name for consistent container naming in Docker Desktop
-os.environ["COMPOSE_PROJECT_NAME"] = "whisper-ui"
-
-# Valid service names (simple names as defined in docker-compose.yml)
-SERVICES = [
-    "postgres",
-    "backend",
-    "frontend",
-    "ngrok-backend",
-    "ngrok-frontend",
-    "ngrok-llm"
-]
+from scripts.docker.common import SERVICES, compose_base, run_or_exec
 
 
 def main():
@@ -50,12 +37,10 @@ def main():
 
     args = parser.parse_args()
 
-    # Base command with env file
-    cmd = ["docker-compose", "--env-file", "src/presentation/api/.env"]
-
-    # Add ngrok profile by default (unless --no-ngrok specified or viewing ngrok service only)
-    if not args.no_ngrok or (args.service and args.service.startswith("ngrok-")):
-        cmd.extend(["--profile", "ngrok"])
+    # Base command with env file; add ngrok profile by default
+    # (unless --no-ngrok specified or viewing ngrok service only)
+    include_ngrok = not args.no_ngrok or bool(args.service and args.service.startswith("ngrok-"))
+    cmd = list(compose_base(ngrok=include_ngrok))
 
     cmd.append("logs")
 
@@ -68,8 +53,9 @@ def main():
     if args.service:
         cmd.append(args.service)
 
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    # Hand the terminal straight to docker-compose so followed logs are not
+    # relayed through this interpreter
+    run_or_exec(cmd)
 
 
 if __name__ == "__main__":
@@ -6,10 +6,20 @@ Downloads faster-whisper models from HuggingFace Hub to cache volume on containe
 Smart caching: Only downloads missing models unless --force is used.
 """
 import argparse
+import importlib.util
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Use the Rust-based parallel downloader when hf_transfer is installed
+# (huggingface_hub errors out if the flag is set without the package)
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from huggingface_hub import snapshot_download, try_to_load_from_cache
+
 # Fix Unicode encoding for Windows console
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
@@ -21,7 +31,20 @@ DEFAULT_MODELS = ["base"]  # Default model to pre-download
 # Cache directory for HuggingFace Hub (faster-whisper uses this)
 CACHE_DIR = Path.home() / ".cache" / "huggingface"
 
+# Maximum number of models downloaded concurrently (downloads are network-bound)
+MAX_PARALLEL_DOWNLOADS = 4
+
+# Files faster-whisper needs from a model repo (mirrors faster_whisper.utils.download_model)
+MODEL_FILE_PATTERNS = [
+    "config.json",
+    "preprocessor_config.json",
+    "model.bin",
+    "tokenizer.json",
+    "vocabulary.*",
+]
 
+
+@lru_cache(maxsize=None)
 def get_repo_id(model_name: str) -> str:
     """Get HuggingFace repo ID for a model name."""
     repo_map = {
@@ -43,11 +66,10 @@ def get_repo_id(model_name: str) -> str:
     return repo_map.get(model_name, f"Systran/faster-whisper-{model_name}")
 
 
+@lru_cache(maxsize=None)
 def model_exists(model_name: str) -> bool:
-    """Check if a faster-whisper model exists in HuggingFace cache."""
+    """Check if a faster-whisper model exists in HuggingFace cache (memoized per run)."""
     try:
-        from huggingface_hub import try_to_load_from_cache
-
         repo_id = get_repo_id(model_name)
 
         # Check if model.bin exists in cache (main CTranslate2 model file)
@@ -55,40 +77,40 @@ def model_exists(model_name: str) -> bool:
         if cached is not None:
             # Get file size
             file_size_mb = os.path.getsize(cached) / (1024 * 1024)
-            print(f"  Model '{model_name}' found in cache ({file_size_mb:.1f} MB)")
+            print(f"  [{model_name}] Found in cache ({file_size_mb:.1f} MB)")
             return True
 
-        print(f"  Model '{model_name}' not found in cache")
+        print(f"  [{model_name}] Not found in cache")
         return False
 
     except Exception as e:
-        print(f"  Error checking cache for '{model_name}': {e}")
+        print(f"  [{model_name}] Error checking cache: {e}")
         return False
 
 
 def download_model(model_name: str, force: bool = False) -> bool:
     """Download a faster-whisper model if missing or force is True."""
     if not force and model_exists(model_name):
-        print(f"  Skipping '{model_name}' (already cached, use --force to re-download)")
+        print(f"  [{model_name}] Skipping (already cached, use --force to re-download)")
         return True
 
     try:
-        from faster_whisper import WhisperModel
-
-        print(f"  Downloading model '{model_name}' from HuggingFace Hub...")
-
-        # Loading the model triggers download if not cached
-        # Use CPU and int8 to minimize memory during preload
-        model = WhisperModel(model_name, device="cpu", compute_type="int8")
-
-        # Release model from memory
-        del model
-
-        print(f"  Successfully downloaded '{model_name}'")
+        print(f"  [{model_name}] Downloading from HuggingFace Hub...")
+
+        # Fetch the model files straight into the HuggingFace cache; no need to
+        # load weights or build a CTranslate2 session just to warm the cache
+        snapshot_download(
+            get_repo_id(model_name),
+            allow_patterns=MODEL_FILE_PATTERNS,
+            max_workers=8,
+            force_download=force
+        )
+
+        print(f"  [{model_name}] Successfully downloaded")
         return True
 
     except Exception as e:
-        print(f"  Failed to download '{model_name}': {e}")
+        print(f"  [{model_name}] Failed to download: {e}")
         return False
 
 
@@ -151,17 +173,18 @@ def main():
     # Ensure cache directory exists
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Download models
-    success_count = 0
-    failure_count = 0
+    # Download models concurrently; per-model output is prefixed with [model] so
+    # interleaved lines stay attributable
+    max_workers = min(MAX_PARALLEL_DOWNLOADS, len(models_to_download))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            lambda model: download_model(model, force=args.force),
+            models_to_download
+        ))
+    print()
 
-    for model in models_to_download:
-        print(f"Processing '{model}':")
-        if download_model(model, force=args.force):
-            success_count += 1
-        else:
-            failure_count += 1
-        print()  # Blank line between models
+    success_count = sum(results)
+    failure_count = len(results) - success_count
 
     # Summary
     print("=" * 60)
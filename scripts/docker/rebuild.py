@@ -12,36 +12,151 @@ Rebuilds all services by default (including ngrok tunnels):
 Usage:
     python scripts/docker/rebuild.py             # Rebuild all services (including ngrok)
     python scripts/docker/rebuild.py --no-ngrok  # Rebuild without ngrok tunnels
+    python scripts/docker/rebuild.py --force     # Rebuild even if nothing changed
+
+Skips down + build when the build inputs (compose file, Dockerfiles, src/,
+scripts/) are unchanged since the last successful rebuild and all services
+are already running.
 
 Note: Ngrok requires NGROK_AUTHTOKEN in src/presentation/api/.env
 """
+import asyncio
+import hashlib
+import os
+import re
 import subprocess
 import sys
 import argparse
-import os
-
-# Fix Unicode encoding for Windows console
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-
-# Set Docker Compose project name for consistent container naming in Docker Desktop
-os.environ["COMPOSE_PROJECT_NAME"] = "whisper-ui"
+from pathlib import Path
+
+# Add project root to path (scripts/docker/ -> scripts/ -> project root)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.docker.common import DOWN_ARGS, SERVICES, compose_base, compose_command, print_banner, run_alongside
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Fingerprint of the build inputs from the last successful rebuild
+BUILD_HASH_FILE = PROJECT_ROOT / ".docker-build-hash"
+
+# Files and directories whose contents end up in the images
+BUILD_INPUTS = [
+    "docker-compose.yml",
+    "src/presentation/api/Dockerfile",
+    "src/presentation/frontend/Dockerfile",
+    "src/presentation/api/requirements.txt",
+    "src",
+    "scripts",
+]
+
+# Directories excluded from the build context by .dockerignore
+SKIP_DIRS = {"__pycache__", "node_modules", "dist", ".angular"}
+
+# Dockerfiles whose base images are pre-pulled before building
+DOCKERFILES = [
+    "src/presentation/api/Dockerfile",
+    "src/presentation/frontend/Dockerfile",
+]
+
+# Matches "FROM <image> [AS <stage>]" lines
+FROM_PATTERN = re.compile(r"^FROM\s+(?:--\S+\s+)*(\S+)", re.IGNORECASE | re.MULTILINE)
+
+
+def _hash_tree(hasher, path):
+    """Feed path, mtime and size of every file under path into hasher"""
+    with os.scandir(path) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    _hash_tree(hasher, entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                hasher.update(f"{entry.path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+
+
+def compute_build_hash():
+    """Fingerprint the build inputs from file paths, mtimes and sizes"""
+    hasher = hashlib.sha256()
+    for name in BUILD_INPUTS:
+        path = PROJECT_ROOT / name
+        if path.is_dir():
+            _hash_tree(hasher, path)
+        elif path.is_file():
+            stat = path.stat()
+            hasher.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+    return hasher.hexdigest()
+
+
+def base_images():
+    """Collect external base images referenced by FROM lines in the Dockerfiles"""
+    images = []
+    for name in DOCKERFILES:
+        path = PROJECT_ROOT / name
+        if not path.exists():
+            continue
+        content = path.read_text(encoding="utf-8")
+        stages = {m.lower() for m in re.findall(r"^FROM\s+\S+\s+AS\s+(\S+)", content,
+                                                 re.IGNORECASE | re.MULTILINE)}
+        for image in FROM_PATTERN.findall(content):
+            if image.lower() not in stages and image not in images:
+                images.append(image)
+    return images
+
+
+async def _stop_and_prefetch(down_cmd, images):
+    """Run compose down while pulling base images concurrently"""
+    down = await asyncio.create_subprocess_exec(*down_cmd)
+    pulls = [
+        await asyncio.create_subprocess_exec(
+            "docker", "pull", "--quiet", image,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        for image in images
+    ]
+    # Pull failures are ignored; the build reports real registry problems
+    await asyncio.gather(down.wait(), *(proc.wait() for proc in pulls))
+
+
+def all_services_running(include_ngrok):
+    """Check whether every expected service is currently running (one compose call)"""
+    expected = {service for service in SERVICES
+                if include_ngrok or not service.startswith("ngrok-")}
+    running = subprocess.run(
+        list(compose_base(ngrok=include_ngrok)) + ["ps", "--services", "--filter", "status=running"],
+        capture_output=True, text=True
+    )
+    if running.returncode != 0:
+        return False
+    return expected <= set(running.stdout.split())
 
 
 def main():
     parser = argparse.ArgumentParser(description="Rebuild and restart Docker containers")
     parser.add_argument("--no-ngrok", action="store_true", help="Exclude ngrok tunnels (rebuild core services only)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if build inputs are unchanged")
 
     args = parser.parse_args()
 
-    # Env file for docker-compose
-    env_file = ["--env-file", "src/presentation/api/.env"]
+    build_hash = compute_build_hash()
+    if (not args.force
+            and BUILD_HASH_FILE.exists()
+            and BUILD_HASH_FILE.read_text().strip() == build_hash
+            and all_services_running(include_ngrok=not args.no_ngrok)):
+        print("[OK] No changes since last rebuild and all services are already up.")
+        print("Use --force to rebuild anyway.")
+        sys.exit(0)
 
-    print("Stopping containers...")
-    subprocess.run(["docker-compose"] + env_file + ["--profile", "ngrok", "down"])
+    print("Stopping containers (pre-pulling base images in parallel)...")
+    asyncio.run(_stop_and_prefetch(list(compose_base(ngrok=True) + DOWN_ARGS), base_images()))
 
     print("\nRebuilding images...")
-    result = subprocess.run(["docker-compose"] + env_file + ["build"])
+    # Embed inline cache metadata so built images can seed later --cache-from builds
+    build_cmd = list(compose_base(ngrok=False)) + ["build", "--build-arg", "BUILDKIT_INLINE_CACHE=1"]
+    # Compose V2 builds services concurrently by default; V1 needs --parallel
+    if compose_command() == ("docker-compose",):
+        build_cmd.append("--parallel")
+    result = subprocess.run(build_cmd)
 
     if result.returncode != 0:
         print("\n[X] Build failed!")
@@ -49,29 +164,15 @@ def main():
 
     print("\nStarting containers...")
 
-    # Base command with env file
-    cmd = ["docker-compose"] + env_file
-
-    # Add ngrok profile by default (unless --no-ngrok specified)
-    if not args.no_ngrok:
-        cmd.extend(["--profile", "ngrok"])
-        print("Starting all services including ngrok tunnels...")
-        print("  Backend tunnel:  https://anas-hammo-whisper-backend.ngrok.dev")
-        print("  Frontend tunnel: https://anas-hammo-whisper-frontend.ngrok.dev")
-        print("  LLM tunnel:      https://anas-hammo-whisper-llm.ngrok.dev")
-        print("\nNgrok Web UI:")
-        print("  Backend:  http://localhost:4050")
-        print("  Frontend: http://localhost:4051")
-        print("  LLM:      http://localhost:4052")
-    else:
-        print("Starting core services only (postgres, backend, frontend)...")
-        print("Use without --no-ngrok to include ngrok tunnels")
-
+    # Base command with env file; add ngrok profile by default (unless --no-ngrok specified)
+    cmd = list(compose_base(ngrok=not args.no_ngrok))
     cmd.extend(["up", "-d"])
 
-    result = subprocess.run(cmd)
+    # Print the service banner while containers are being created
+    returncode = run_alongside(cmd, lambda: print_banner(args.no_ngrok))
 
-    if result.returncode == 0:
+    if returncode == 0:
+        BUILD_HASH_FILE.write_text(build_hash)
         print("\n[OK] Rebuild and restart complete!")
         print("\nView logs with: python scripts/docker/logs.py -f")
     else:
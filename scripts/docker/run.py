@@ -14,20 +14,19 @@ Usage:
     python scripts/docker/run.py --no-ngrok   # Start without ngrok tunnels
     python scripts/docker/run.py --build      # Build and start
     python scripts/docker/run.py -d           # Start detached
+    python scripts/docker/run.py --verbose    # Print the docker compose command
 
 Note: Ngrok requires NGROK_AUTHTOKEN in src/presentation/api/.env
 """
-import subprocess
+import shlex
 import sys
 import argparse
-import os
+from pathlib import Path
 
-# Fix Unicode encoding for Windows console
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
+# Add project root to path (scripts/docker/ -> scripts/ -> project root)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Set Docker Compose project name for consistent container naming in Docker Desktop
-os.environ["COMPOSE_PROJECT_NAME"] = "whisper-ui"
+from scripts.docker.common import compose_base, print_banner, run_alongside, run_or_exec
 
 
 def main():
@@ -35,26 +34,12 @@ def main():
     parser.add_argument("--build", action="store_true", help="Build images before starting")
     parser.add_argument("--detach", "-d", action="store_true", help="Run in detached mode")
     parser.add_argument("--no-ngrok", action="store_true", help="Exclude ngrok tunnels (start core services only)")
+    parser.add_argument("--verbose", action="store_true", help="Print the docker compose command")
 
     args = parser.parse_args()
 
-    # Base command with env file
-    cmd = ["docker-compose", "--env-file", "src/presentation/api/.env"]
-
-    # Add ngrok profile by default (unless --no-ngrok specified)
-    if not args.no_ngrok:
-        cmd.extend(["--profile", "ngrok"])
-        print("Starting all services including ngrok tunnels...")
-        print("  Backend tunnel:  https://anas-hammo-whisper-backend.ngrok.dev")
-        print("  Frontend tunnel: https://anas-hammo-whisper-frontend.ngrok.dev")
-        print("  LLM tunnel:      https://anas-hammo-whisper-llm.ngrok.dev")
-        print("\nNgrok Web UI:")
-        print("  Backend:  http://localhost:4050")
-        print("  Frontend: http://localhost:4051")
-        print("  LLM:      http://localhost:4052")
-    else:
-        print("Starting core services only (postgres, backend, frontend)...")
-        print("Use without --no-ngrok to include ngrok tunnels")
+    # Base command with env file; add ngrok profile by default (unless --no-ngrok specified)
+    cmd = list(compose_base(ngrok=not args.no_ngrok))
 
     cmd.append("up")
 
@@ -65,12 +50,17 @@ def main():
     if args.detach:
         cmd.append("-d")
 
-    # Run command
-    print(f"\nRunning: {' '.join(cmd)}")
-    result = subprocess.run(cmd)
+    if args.verbose:
+        print(f"Running: {shlex.join(cmd)}\n")
 
-    sys.exit(result.returncode)
+    # Detached: print the service banner while containers start
+    if args.detach:
+        sys.exit(run_alongside(cmd, lambda: print_banner(args.no_ngrok)))
 
+    # Foreground: compose owns the terminal until exit, so hand the process over
+    print_banner(args.no_ngrok)
+    print()
+    run_or_exec(cmd)
 
 if __name__ == "__main__":
     main()
@@ -13,39 +13,53 @@ Usage:
     python scripts/docker/shell.py backend   # Open bash in backend container
     python scripts/docker/shell.py postgres  # Open sh in postgres container
 """
-import subprocess
 import sys
-import argparse
-import os
+import types
+from pathlib import Path
 
-# Set Docker Compose project name for consistent container naming in Docker Desktop
-os.environ["COMPOSE_PROJECT_NAME"] = "whisper-ui"
+# Add project root to path (scripts/docker/ -> scripts/ -> project root)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Service name to (container name, shell) mapping
-CONTAINER_MAP = {
+from scripts.docker.common import run_or_exec
+
+# Service name to (container name, shell) mapping (read-only)
+CONTAINER_MAP = types.MappingProxyType({
     "backend": ("whisper-backend", "bash"),
     "frontend": ("whisper-frontend", "sh"),
     "postgres": ("whisper-postgres", "sh"),
     "ngrok-backend": ("ngrok-whisper-backend", "sh"),
     "ngrok-frontend": ("ngrok-whisper-frontend", "sh"),
     "ngrok-llm": ("ngrok-whisper-llm", "sh")
-}
+})
 
+# Valid service names for argument parsing
+SERVICE_CHOICES = tuple(CONTAINER_MAP)
+
+
+def parse_service(argv):
+    """Return the requested service, building an argparse parser only for help or bad input"""
+    if len(argv) == 1 and argv[0] in CONTAINER_MAP:
+        return argv[0]
+
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(description="Open shell in running container")
-    parser.add_argument("service", choices=list(CONTAINER_MAP.keys()),
+    parser.add_argument("service", choices=SERVICE_CHOICES,
                        help="Service to open shell in")
 
-    args = parser.parse_args()
+    return parser.parse_args(argv).service
+
+
+def main():
+    service = parse_service(sys.argv[1:])
 
-    container_name, shell = CONTAINER_MAP[args.service]
+    container_name, shell = CONTAINER_MAP[service]
 
     cmd = ["docker", "exec", "-it", container_name, shell]
 
     print(f"Opening {shell} in {container_name}...")
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    # Replace this process with docker exec for the whole interactive session
+    run_or_exec(cmd)
 
 
 if __name__ == "__main__":
@@ -13,45 +13,63 @@ Usage:
     python scripts/docker/stop.py              # Stop all services
     python scripts/docker/stop.py -v           # Stop and remove volumes (WARNING: deletes data)
     python scripts/docker/stop.py --ngrok-only # Stop only ngrok tunnels
+    python scripts/docker/stop.py --verbose    # Print the docker compose command
 """
-import subprocess
+import asyncio
+import shlex
 import sys
-import argparse
-import os
+import types
+from pathlib import Path
 
-# Fix Unicode encoding for Windows console
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
+# Add project root to path (scripts/docker/ -> scripts/ -> project root)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Set Docker Compose project name for consistent container naming in Docker Desktop
-os.environ["COMPOSE_PROJECT_NAME"] = "whisper-ui"
+from scripts.docker.common import NGROK_CONTAINERS, compose_base, run_or_exec
 
 
-def main():
+async def stop_containers(names):
+    """Stop containers concurrently, ignoring ones that are not running"""
+    procs = [
+        await asyncio.create_subprocess_exec(
+            "docker", "stop", name,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        for name in names
+    ]
+    await asyncio.gather(*(proc.wait() for proc in procs))
+
+
+def parse_args(argv):
+    """Parse command line arguments, skipping argparse for the no-argument case"""
+    if not argv:
+        return types.SimpleNamespace(remove_volumes=False, ngrok_only=False, verbose=False)
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Stop Docker Compose services")
     parser.add_argument("--remove-volumes", "-v", action="store_true",
                        help="Remove volumes as well (WARNING: deletes data)")
     parser.add_argument("--ngrok-only", action="store_true",
                        help="Stop only ngrok tunnel services")
+    parser.add_argument("--verbose", action="store_true",
+                       help="Print the docker compose command")
+
+    return parser.parse_args(argv)
 
-    args = parser.parse_args()
 
-    # Env file for docker-compose
-    env_file = ["--env-file", "src/presentation/api/.env"]
+def main():
+    args = parse_args(sys.argv[1:])
 
     if args.ngrok_only:
         # Stop only ngrok containers by name
         print("Stopping ngrok tunnel services...")
-        cmd = ["docker", "stop",
-               "ngrok-whisper-backend",
-               "ngrok-whisper-frontend",
-               "ngrok-whisper-llm"]
-        subprocess.run(cmd, stderr=subprocess.DEVNULL)
+        asyncio.run(stop_containers(NGROK_CONTAINERS))
         print("[OK] Ngrok tunnels stopped!")
         sys.exit(0)
 
     # Stop all services (with profile to include ngrok if running)
-    cmd = ["docker-compose"] + env_file + ["--profile", "ngrok", "down"]
+    cmd = list(compose_base(ngrok=True)) + ["down"]
 
     if args.remove_volumes:
         print("WARNING: This will remove all volumes and delete data!")
@@ -62,9 +80,9 @@ def main():
         cmd.append("-v")
 
     print("Stopping all services...")
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    if args.verbose:
+        print(f"Running: {shlex.join(cmd)}")
+    run_or_exec(cmd)
 
 
 if __name__ == "__main__":
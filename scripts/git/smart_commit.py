@@ -9,16 +9,23 @@ Usage:
     python scripts/git/smart_commit.py --type feat --scope ui --message "Add new feature"
 """
 
+import os
+import posixpath
+import re
 import sys
 import subprocess
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+# Working directory for git commands, converted from Path once
+PROJECT_DIR = str(project_root)
+
 from scripts.utils.terminal import Colors
 
 
@@ -33,6 +40,10 @@ COMMIT_TYPES = {
     'perf': 'Perf: Performance improvement',
 }
 
+# Commit types in menu order, built once for selection by number
+COMMIT_TYPE_KEYS = tuple(COMMIT_TYPES)
+COMMIT_TYPE_ITEMS = tuple(COMMIT_TYPES.items())
+
 STANDARD_FOOTER = """
 🤖 Generated with [Claude Code](https://claude.com/claude-code)
 
@@ -47,96 +58,194 @@ def run_command(cmd: List[str]) -> Tuple[int, str, str]:
             cmd,
             capture_output=True,
             text=True,
-            cwd=project_root
+            cwd=PROJECT_DIR
         )
         return result.returncode, result.stdout, result.stderr
     except Exception as e:
         return 1, "", str(e)
 
 
-def get_git_status() -> Tuple[List[str], List[str]]:
-    """Get staged and unstaged changes"""
-    # Staged files
-    returncode, stdout, _ = run_command(['git', 'diff', '--cached', '--name-only'])
-    staged = stdout.strip().split('\n') if returncode == 0 and stdout.strip() else []
+def run_command_bytes(cmd: List[str]) -> Tuple[int, bytes, bytes]:
+    """Run a command and return status, stdout, stderr as undecoded bytes"""
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            cwd=PROJECT_DIR
+        )
+        return result.returncode, result.stdout, result.stderr
+    except Exception as e:
+        return 1, b"", str(e).encode()
+
+
+def run_command_lines(cmd: List[str], limit: Optional[int] = None) -> Iterator[str]:
+    """Run a command and yield its stdout lines, stopping it after limit lines"""
+    try:
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            cwd=PROJECT_DIR
+        ) as proc:
+            for count, line in enumerate(proc.stdout, 1):
+                yield line.rstrip('\n')
+                if limit is not None and count >= limit:
+                    proc.terminate()
+                    break
+    except OSError:
+        return
+
+
+def get_git_status() -> Tuple[str, List[bytes], List[bytes]]:
+    """
+    Get current branch, staged and unstaged changes from a single git call.
+
+    File paths are returned as bytes; decode them with os.fsdecode for display.
+    """
+    returncode, stdout, _ = run_command_bytes(
+        ['git', 'status', '--porcelain=v1', '-b', '-z', '--untracked-files=no']
+    )
+    if returncode != 0:
+        return "unknown", [], []
+
+    records = stdout.split(b'\0')
+
+    # First record is the branch header: "## main...origin/main [ahead 1]"
+    header = os.fsdecode(records[0][3:]) if records[0].startswith(b'## ') else ''
+    if header.startswith('No commits yet on '):
+        branch = header[len('No commits yet on '):]
+    elif header.startswith('HEAD (no branch)'):
+        branch = ''
+    else:
+        branch = header.split('...', 1)[0].split(' ', 1)[0]
+
+    staged = []
+    unstaged = []
+    entries = iter(records[1:])
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        x, y, path = entry[0:1], entry[1:2], entry[3:]
+        if x != b' ':
+            staged.append(path)
+        if y != b' ':
+            unstaged.append(path)
+        # Renames and copies are followed by a record holding the original path
+        if x in b'RC' or y in b'RC':
+            next(entries, None)
+
+    return branch, staged, unstaged
+
+
+# File category flags collected by classify_files
+DOCS = 1
+TESTS = 2
+FRONTEND = 4
+BACKEND = 8
+SCRIPTS = 16
+README = 32
+
+# One alternation covering every category; each match's group name selects its flag.
+# Patterns are bytes so git's undecoded paths are matched directly
+FILE_CLASSIFIER = re.compile(
+    rb'(?P<docs>\.md)'
+    rb'|(?P<readme>README)'
+    rb'|(?P<tests>(?i:test|spec))'
+    rb'|(?P<frontend>frontend)'
+    rb'|(?P<backend>api|routers|use_cases|domain|infrastructure)'
+    rb'|(?P<scripts>scripts)'
+)
+
+# Only the categories that decide the commit type
+TYPE_CLASSIFIER = re.compile(
+    rb'(?P<docs>\.md)'
+    rb'|(?P<readme>README)'
+    rb'|(?P<tests>(?i:test|spec))'
+)
+
+CATEGORY_FLAGS = {
+    'docs': DOCS,
+    'readme': README,
+    'tests': TESTS,
+    'frontend': FRONTEND,
+    'backend': BACKEND,
+    'scripts': SCRIPTS,
+}
+
+# Scope implied by a directory that contains every changed file
+AREA_SCOPES = {
+    FRONTEND: 'frontend',
+    BACKEND: 'backend',
+    SCRIPTS: 'scripts',
+}
 
-    # Unstaged files
-    returncode, stdout, _ = run_command(['git', 'diff', '--name-only'])
-    unstaged = stdout.strip().split('\n') if returncode == 0 and stdout.strip() else []
 
-    return staged, unstaged
+def area_scope(files: List[bytes]) -> str:
+    """Return the scope of a single area (frontend/backend/scripts) shared by all files, or ''"""
+    # git reports paths with forward slashes on every platform
+    prefix = posixpath.commonpath(files)
+    if len(files) == 1:
+        prefix = posixpath.dirname(prefix)
 
+    flags = 0
+    for match in FILE_CLASSIFIER.finditer(prefix):
+        flags |= CATEGORY_FLAGS[match.lastgroup]
+    return AREA_SCOPES.get(flags & (FRONTEND | BACKEND | SCRIPTS), '')
 
-def get_current_branch() -> str:
-    """Get current git branch name"""
-    returncode, stdout, _ = run_command(['git', 'branch', '--show-current'])
-    return stdout.strip() if returncode == 0 else "unknown"
 
+def classify_files(files: List[bytes]) -> Tuple[str, str]:
+    """Suggest commit type and scope from changed files in a single pass"""
+    if not files:
+        return 'feat', ''
 
-def suggest_commit_type(files: List[str]) -> str:
-    """Suggest commit type based on changed files"""
-    if not files or files == ['']:
-        return 'feat'
+    # When all files live under one area the scope is known up front,
+    # and only the type categories need to be matched per file
+    scope = area_scope(files)
+    classifier = TYPE_CLASSIFIER if scope else FILE_CLASSIFIER
 
-    # Count file types
-    has_docs = any('.md' in f or 'README' in f for f in files)
-    has_tests = any('test' in f.lower() or 'spec' in f.lower() for f in files)
-    has_frontend = any('frontend' in f or '.html' in f or '.css' in f or '.ts' in f for f in files)
-    has_backend = any('backend' in f or 'api' in f or '.py' in f for f in files)
+    flags = 0
+    for f in files:
+        for match in classifier.finditer(f):
+            flags |= CATEGORY_FLAGS[match.lastgroup]
 
-    if has_docs:
-        return 'docs'
-    elif has_tests:
-        return 'test'
-    elif has_frontend or has_backend:
-        return 'feat'
+    if flags & (DOCS | README):
+        commit_type = 'docs'
+    elif flags & TESTS:
+        commit_type = 'test'
     else:
-        return 'feat'
-
-
-def suggest_scope(files: List[str]) -> str:
-    """Suggest commit scope based on changed files"""
-    if not files or files == ['']:
-        return ''
-
-    # Analyze file paths
-    has_frontend = any('frontend' in f for f in files)
-    has_backend = any(any(x in f for x in ['api', 'routers', 'use_cases', 'domain', 'infrastructure']) for f in files)
-    has_docs = any('.md' in f for f in files)
-    has_scripts = any('scripts' in f for f in files)
-
-    if has_frontend and has_backend:
-        return 'fullstack'
-    elif has_frontend:
-        return 'frontend'
-    elif has_backend:
-        return 'backend'
-    elif has_docs:
-        return 'docs'
-    elif has_scripts:
-        return 'scripts'
-    else:
-        return ''
+        commit_type = 'feat'
+
+    if not scope:
+        if flags & FRONTEND and flags & BACKEND:
+            scope = 'fullstack'
+        elif flags & FRONTEND:
+            scope = 'frontend'
+        elif flags & BACKEND:
+            scope = 'backend'
+        elif flags & DOCS:
+            scope = 'docs'
+        elif flags & SCRIPTS:
+            scope = 'scripts'
+
+    return commit_type, scope
 
 
+@lru_cache(maxsize=None)
 def format_commit_message(commit_type: str, scope: str, message: str, body: str = "") -> str:
     """Format commit message with standard footer"""
-    # Build the commit message
-    type_prefix = commit_type.capitalize()
-
+    # Collect the fragments and join them once
+    parts = [commit_type.capitalize()]
     if scope:
-        first_line = f"{type_prefix}({scope}): {message}"
-    else:
-        first_line = f"{type_prefix}: {message}"
-
-    full_message = first_line
+        parts += ['(', scope, ')']
+    parts += [': ', message]
 
     if body:
-        full_message += f"\n\n{body}"
+        parts += ['\n\n', body]
 
-    full_message += STANDARD_FOOTER
+    parts.append(STANDARD_FOOTER)
 
-    return full_message
+    return ''.join(parts)
 
 
 def interactive_commit():
@@ -144,19 +253,18 @@ def interactive_commit():
     print(f"\n{Colors.CYAN}{Colors.BOLD}Smart Commit Helper{Colors.RESET}\n")
 
     # Check git status
-    staged, unstaged = get_git_status()
-    branch = get_current_branch()
+    branch, staged, unstaged = get_git_status()
 
     print(f"{Colors.BLUE}Current branch:{Colors.RESET} {branch}")
 
-    if not staged or staged == ['']:
+    if not staged:
         print(f"\n{Colors.RED}No staged changes found!{Colors.RESET}")
         print(f"{Colors.YELLOW}Run 'git add <files>' to stage changes first.{Colors.RESET}\n")
 
-        if unstaged and unstaged != ['']:
+        if unstaged:
             print(f"{Colors.YELLOW}Unstaged files:{Colors.RESET}")
             for f in unstaged[:10]:  # Show max 10 files
-                print(f"  - {f}")
+                print(f"  - {os.fsdecode(f)}")
             if len(unstaged) > 10:
                 print(f"  ... and {len(unstaged) - 10} more")
 
@@ -164,17 +272,16 @@ def interactive_commit():
 
     print(f"\n{Colors.GREEN}Staged files ({len(staged)}):{Colors.RESET}")
     for f in staged[:15]:  # Show max 15 files
-        print(f"  - {f}")
+        print(f"  - {os.fsdecode(f)}")
     if len(staged) > 15:
         print(f"  ... and {len(staged) - 15} more")
 
     # Suggest type and scope
-    suggested_type = suggest_commit_type(staged)
-    suggested_scope = suggest_scope(staged)
+    suggested_type, suggested_scope = classify_files(staged)
 
     # Select commit type
     print(f"\n{Colors.CYAN}Select commit type:{Colors.RESET}")
-    for i, (key, desc) in enumerate(COMMIT_TYPES.items(), 1):
+    for i, (key, desc) in enumerate(COMMIT_TYPE_ITEMS, 1):
         marker = f"{Colors.GREEN}>{Colors.RESET}" if key == suggested_type else " "
         print(f"  {marker} [{i}] {key}: {desc}")
 
@@ -182,8 +289,8 @@ def interactive_commit():
 
     if type_input.isdigit():
         type_index = int(type_input) - 1
-        if 0 <= type_index < len(COMMIT_TYPES):
-            commit_type = list(COMMIT_TYPES.keys())[type_index]
+        if 0 <= type_index < len(COMMIT_TYPE_KEYS):
+            commit_type = COMMIT_TYPE_KEYS[type_index]
         else:
             commit_type = suggested_type
     elif type_input in COMMIT_TYPES:
@@ -206,14 +313,8 @@ def interactive_commit():
     print(f"\n{Colors.YELLOW}Enter commit body (optional, press Enter to skip):{Colors.RESET}")
     print(f"{Colors.YELLOW}Type your message and press Ctrl+Z (Windows) or Ctrl+D (Unix) when done:{Colors.RESET}")
     try:
-        body_lines = []
-        while True:
-            try:
-                line = input()
-                body_lines.append(line)
-            except EOFError:
-                break
-        body = '\n'.join(body_lines).strip()
+        # Read everything up to EOF in one call
+        body = sys.stdin.read().strip()
     except KeyboardInterrupt:
         body = ""
 
@@ -238,9 +339,8 @@ def interactive_commit():
             print(f"\n{Colors.GREEN}[OK] Commit created successfully!{Colors.RESET}")
 
             # Show commit hash
-            returncode, stdout, _ = run_command(['git', 'log', '-1', '--format=%H %s'])
-            if returncode == 0:
-                print(f"{Colors.BLUE}Commit:{Colors.RESET} {stdout.strip()}")
+            for line in run_command_lines(['git', 'log', '-1', '--format=%H %s'], limit=1):
+                print(f"{Colors.BLUE}Commit:{Colors.RESET} {line}")
 
             return True
         else:
@@ -255,7 +355,7 @@ def interactive_commit():
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Smart commit helper with standardized messages')
-    parser.add_argument('--type', choices=COMMIT_TYPES.keys(), help='Commit type')
+    parser.add_argument('--type', choices=COMMIT_TYPE_KEYS, help='Commit type')
     parser.add_argument('--scope', help='Commit scope (e.g., frontend, backend)')
     parser.add_argument('--message', '-m', help='Commit message')
     parser.add_argument('--body', '-b', help='Commit body')
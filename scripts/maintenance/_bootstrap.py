@@ -0,0 +1,13 @@
+"""Put the project root on sys.path for the maintenance scripts
+
+Scripts in this directory import it first with ``import _bootstrap``; their
+own directory is already on sys.path when they are run directly.
+"""
+import os
+import sys
+
+# scripts/maintenance/ -> scripts/ -> project root (plain strings, no Path objects)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
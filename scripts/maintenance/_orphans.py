@@ -0,0 +1,50 @@
+"""Orphaned transcription helpers shared by the orphan cleanup scripts
+
+SQLAlchemy and the models are imported inside the functions, so importing
+this module stays cheap.
+"""
+
+
+def orphans_query():
+    """Columns of transcriptions whose audio file no longer exists (anti-join runs in the database)"""
+    from sqlalchemy import exists, select
+    from src.infrastructure.persistence.models.transcription_model import TranscriptionModel
+    from src.infrastructure.persistence.models.audio_file_model import AudioFileModel
+
+    # Plain row tuples of the displayed columns, no ORM instances
+    return select(
+        TranscriptionModel.id,
+        TranscriptionModel.audio_file_id,
+        TranscriptionModel.model,
+        TranscriptionModel.status,
+        TranscriptionModel.enable_llm_enhancement,
+        TranscriptionModel.llm_enhancement_status
+    ).where(
+        ~exists().where(AudioFileModel.id == TranscriptionModel.audio_file_id)
+    ).execution_options(yield_per=1000)
+
+
+def format_orphan(trans):
+    """Format one orphaned transcription row for the listing"""
+    llm = f' | LLM: {trans.llm_enhancement_status or "pending"}' if trans.enable_llm_enhancement else ''
+    return f'  - ID: {trans.id[:8]}... | Audio File ID: {trans.audio_file_id[:8]}... | Model: {trans.model} | Status: {trans.status.value}{llm}'
+
+
+# Maximum number of ids per DELETE statement (keeps under SQLite's bind parameter limit)
+DELETE_BATCH_SIZE = 500
+
+
+def delete_transcriptions(db, ids):
+    """Delete transcriptions by id in batches, returning the number of deleted rows"""
+    from sqlalchemy import delete
+    from src.infrastructure.persistence.models.transcription_model import TranscriptionModel
+
+    deleted = 0
+    for start in range(0, len(ids), DELETE_BATCH_SIZE):
+        result = db.execute(
+            delete(TranscriptionModel)
+            .where(TranscriptionModel.id.in_(ids[start:start + DELETE_BATCH_SIZE]))
+            .execution_options(synchronize_session=False)
+        )
+        deleted += result.rowcount
+    return deleted
@@ -1,50 +1,50 @@
 """Automatically clean up orphaned transcriptions without confirmation"""
 import sys
-from pathlib import Path
 
 # Add project root to path (scripts/maintenance/ -> scripts/ -> project root)
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.infrastructure.persistence.database import SessionLocal
-from src.infrastructure.persistence.models.transcription_model import TranscriptionModel
-from src.infrastructure.persistence.models.audio_file_model import AudioFileModel
-
-db = SessionLocal()
-try:
-    # Get all transcriptions
-    all_transcriptions = db.query(TranscriptionModel).all()
-    print(f'Total transcriptions: {len(all_transcriptions)}')
-
-    # Get all audio file IDs
-    all_audio_files = db.query(AudioFileModel).all()
-    audio_file_ids = {af.id for af in all_audio_files}
-    print(f'Total audio files: {len(audio_file_ids)}')
-    print()
-
-    # Find orphaned transcriptions
-    orphaned = []
-    for trans in all_transcriptions:
-        if trans.audio_file_id not in audio_file_ids:
-            orphaned.append(trans)
-
-    print(f'Orphaned transcriptions found: {len(orphaned)}')
-
-    if orphaned:
-        print('\nOrphaned transcriptions:')
-        for trans in orphaned:
-            info = f'  - ID: {trans.id[:8]}... | Audio File ID: {trans.audio_file_id[:8]}... | Model: {trans.model} | Status: {trans.status.value}'
-            if trans.enable_llm_enhancement:
-                llm_status = trans.llm_enhancement_status or 'pending'
-                info += f' | LLM: {llm_status}'
-            print(info)
-
-        print('\nDeleting orphaned transcriptions...')
-        for trans in orphaned:
-            db.delete(trans)
-        db.commit()
-        print(f'\nSuccessfully deleted {len(orphaned)} orphaned transcriptions')
-    else:
-        print('\nNo orphaned transcriptions found - database is clean!')
-
-finally:
-    db.close()
+import _bootstrap  # noqa: F401
+
+from _orphans import delete_transcriptions, format_orphan, orphans_query
+
+
+def main():
+    # Imported here so the SQLAlchemy stack is only loaded when the script runs
+    from sqlalchemy import func, select
+    from src.infrastructure.persistence.database import SessionLocal
+    from src.infrastructure.persistence.models.transcription_model import TranscriptionModel
+    from src.infrastructure.persistence.models.audio_file_model import AudioFileModel
+
+    with SessionLocal() as db:
+        total_transcriptions = db.execute(select(func.count(TranscriptionModel.id))).scalar()
+        print(f'Total transcriptions: {total_transcriptions}')
+        if not total_transcriptions:
+            print('\nNo orphaned transcriptions found - database is clean!')
+            return
+
+        total_audio_files = db.execute(select(func.count(AudioFileModel.id))).scalar()
+        print(f'Total audio files: {total_audio_files}')
+        print()
+
+        # Stream the orphan rows once, keeping only their ids and listing lines
+        orphan_ids = []
+        lines = []
+        for trans in db.execute(orphans_query()):
+            orphan_ids.append(trans.id)
+            lines.append(format_orphan(trans))
+        print(f'Orphaned transcriptions found: {len(orphan_ids)}')
+
+        if orphan_ids:
+            print('\nOrphaned transcriptions:')
+            # One write for the whole listing instead of one per row
+            sys.stdout.write('\n'.join(lines) + '\n')
+
+            print('\nDeleting orphaned transcriptions...')
+            deleted = delete_transcriptions(db, orphan_ids)
+            db.commit()
+            print(f'\nSuccessfully deleted {deleted} orphaned transcriptions')
+        else:
+            print('\nNo orphaned transcriptions found - database is clean!')
+
+
+if __name__ == "__main__":
+    main()
@@ -1,76 +1,84 @@
 """Debug script to check transcriptions and audio files in database"""
 import sys
-from pathlib import Path
 
 # Add project root to path (scripts/maintenance/ -> scripts/ -> project root)
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 import asyncio
+from collections import defaultdict
 from src.infrastructure.persistence.database import SessionLocal
 from src.infrastructure.persistence.repositories.sqlite_transcription_repository import SQLiteTranscriptionRepository
 from src.infrastructure.persistence.repositories.sqlite_audio_file_repository import SQLiteAudioFileRepository
 
 
 async def main():
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         transcription_repo = SQLiteTranscriptionRepository(db)
         audio_file_repo = SQLiteAudioFileRepository(db)
 
-        # Get all transcriptions
-        all_transcriptions = await transcription_repo.get_all(limit=100)
-        print(f"\n{'='*60}")
-        print(f"Total Transcriptions: {len(all_transcriptions)}")
-        print(f"{'='*60}\n")
+        # Collect output lines and write them in one call at the end
+        out = []
 
-        # Group by audio file
-        by_audio_file = {}
-        for trans in all_transcriptions:
-            if trans.audio_file_id not in by_audio_file:
-                by_audio_file[trans.audio_file_id] = []
+        # Stream transcription summaries and group them by audio file
+        by_audio_file = defaultdict(list)
+        total_transcriptions = 0
+        async for trans in transcription_repo.stream_summaries(limit=100):
             by_audio_file[trans.audio_file_id].append(trans)
+            total_transcriptions += 1
+
+        out.append(f"\n{'='*60}")
+        out.append(f"Total Transcriptions: {total_transcriptions}")
+        out.append(f"{'='*60}\n")
+
+        # Fetch all referenced audio files in one query
+        audio_files = {}
+        lookup_error = None
+        try:
+            audio_files = await audio_file_repo.get_by_ids(list(by_audio_file))
+        except Exception as e:
+            lookup_error = e
 
         # Show details for each audio file
         for audio_file_id, transcriptions in by_audio_file.items():
-            print(f"\nAudio File ID: {audio_file_id}")
-            print(f"  Number of transcriptions: {len(transcriptions)}")
+            out.append(f"\nAudio File ID: {audio_file_id}")
+            out.append(f"  Number of transcriptions: {len(transcriptions)}")
 
-            # Try to get audio file details
-            try:
-                audio_file = await audio_file_repo.get_by_id(audio_file_id)
-                if audio_file:
-                    print(f"  Original filename: {audio_file.original_filename}")
-                    print(f"  Uploaded at: {audio_file.uploaded_at}")
-                else:
-                    print(f"  [WARNING] Audio file NOT FOUND in database!")
-            except Exception as e:
-                print(f"  [ERROR] getting audio file: {e}")
+            audio_file = audio_files.get(audio_file_id)
+            if lookup_error:
+                out.append(f"  [ERROR] getting audio file: {lookup_error}")
+            elif audio_file:
+                out.append(f"  Original filename: {audio_file.original_filename}")
+                out.append(f"  Uploaded at: {audio_file.uploaded_at}")
+            else:
+                out.append(f"  [WARNING] Audio file NOT FOUND in database!")
 
             # Show transcription details
-            print(f"  Transcriptions:")
+            out.append(f"  Transcriptions:")
             for trans in transcriptions:
-                print(f"    - {trans.model or 'unknown'}: {trans.status} (ID: {trans.id})")
+                out.append(f"    - {trans.model or 'unknown'}: {trans.status.value} (ID: {trans.id})")
                 # Show LLM enhancement info if enabled
                 if trans.enable_llm_enhancement:
-                    llm_status = trans.llm_enhancement_status or 'pending'
-                    print(f"      LLM Enhancement: {llm_status}", end='')
+                    llm_line = f"      LLM Enhancement: {trans.llm_enhancement_status or 'pending'}"
                     if trans.llm_processing_time_seconds:
-                        print(f' ({trans.llm_processing_time_seconds:.2f}s)', end='')
-                    if trans.enhanced_text:
-                        print(f' | Enhanced: {len(trans.enhanced_text)} chars', end='')
+                        llm_line += f' ({trans.llm_processing_time_seconds:.2f}s)'
+                    if trans.enhanced_text_length:
+                        llm_line += f' | Enhanced: {trans.enhanced_text_length} chars'
                     if trans.llm_error_message:
                         error_preview = trans.llm_error_message[:60] + ('...' if len(trans.llm_error_message) > 60 else '')
-                        print(f' | Error: {error_preview}', end='')
-                    print()
+                        llm_line += f' | Error: {error_preview}'
+                    out.append(llm_line)
 
-        print(f"\n{'='*60}")
-        print("Summary:")
-        print(f"  Total audio files: {len(by_audio_file)}")
-        print(f"  Total transcriptions: {len(all_transcriptions)}")
-        print(f"{'='*60}\n")
+        out.append(f"\n{'='*60}")
+        out.append("Summary:")
+        out.append(f"  Total audio files: {len(by_audio_file)}")
+        out.append(f"  Total transcriptions: {total_transcriptions}")
+        out.append(f"{'='*60}\n")
 
-    finally:
-        db.close()
+        # Write pre-encoded UTF-8 bytes to the raw buffer, bypassing the text
+        # layer; flush explicitly since this skips print's line buffering
+        sys.stdout.flush()
+        sys.stdout.buffer.write(("\n".join(out) + "\n").encode("utf-8"))
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -9,11 +9,15 @@ Usage:
     python scripts/maintenance/health_check.py --verbose
 """
 
+import asyncio
+import importlib.util
+import io
 import sys
 import os
-import subprocess
 import sqlite3
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import argparse
@@ -24,6 +28,66 @@ sys.path.insert(0, str(project_root))
 
 from scripts.utils.terminal import Colors
 
+# Paths inspected by the checks, resolved once at import
+DB_PATH = project_root / "whisper_transcriptions.db"
+UPLOADS_DIR = project_root / "uploads"
+REQS_FILE = project_root / "requirements.txt"
+FRONTEND_DIR = project_root / "src" / "presentation" / "frontend"
+NODE_MODULES_DIR = FRONTEND_DIR / "node_modules"
+FFMPEG_DIR = project_root / "ffmpeg-8.0.1-essentials_build" / "bin"
+WHISPER_CACHE_DIR = Path.home() / ".cache" / "whisper"
+
+# Result of a single check: (name, passed, message, is_warning)
+CheckResult = Tuple[str, bool, str, bool]
+
+# Checks are independent and mostly wait on I/O, so they run concurrently
+MAX_CHECK_WORKERS = 8
+
+# Seconds a probe may take; version queries normally return in well under 100ms
+PROBE_TIMEOUT = 2
+
+# External tool probes, launched together before the checks run
+PROBE_COMMANDS = {
+    'git_dir': ['git', 'rev-parse', '--git-dir'],
+    'git_branch': ['git', 'branch', '--show-current'],
+    'node': ['node', '--version'],
+    'npm': ['npm', '--version'],
+    'ffmpeg': ['ffmpeg', '-version'],
+}
+
+
+def result(name: str, passed: bool, message: str = "", is_warning: bool = False) -> CheckResult:
+    """Build a check result"""
+    return name, passed, message, is_warning
+
+
+@lru_cache(maxsize=1)
+def python_version_result() -> CheckResult:
+    """Check Python version (fixed for the process lifetime, so computed once)"""
+    version = sys.version_info
+    passed = version.major == 3 and version.minor >= 9
+    version_str = f"{version.major}.{version.minor}.{version.micro}"
+
+    return result(
+        "Python version",
+        passed,
+        f"Found Python {version_str} (requires 3.9+)",
+        is_warning=not passed
+    )
+
+
+@lru_cache(maxsize=1)
+def virtual_env_result() -> CheckResult:
+    """Check if virtual environment is active (fixed for the process lifetime, so computed once)"""
+    in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+
+    return result(
+        "Virtual environment",
+        in_venv,
+        "Active" if in_venv else "Not activated (recommended to use venv)",
+        is_warning=not in_venv
+    )
+
 
 class HealthChecker:
     def __init__(self, verbose: bool = False):
@@ -32,12 +96,39 @@ class HealthChecker:
         self.checks_total = 0
         self.warnings = []
         self.errors = []
+        self.probes: Dict[str, Tuple[int, str, str]] = {}
+        self._cmd_cache: Dict[Tuple[str, ...], Tuple[int, str, str]] = {}
+
+        # Keep-alive session shared by the server probes, created on first use
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Output is buffered and written once per section
+        self._buf = io.StringIO()
+
+        # Status prefixes, built once
+        self._ok = f"{Colors.GREEN}[OK]{Colors.RESET}"
+        self._warn = f"{Colors.YELLOW}[WARN]{Colors.RESET}"
+        self._fail = f"{Colors.RED}[FAIL]{Colors.RESET}"
+
+    def emit(self, line: str = ""):
+        """Append a line to the output buffer"""
+        self._buf.write(line)
+        self._buf.write("\n")
+
+    def flush(self):
+        """Write the buffered output to stdout in one call"""
+        sys.stdout.write(self._buf.getvalue())
+        sys.stdout.flush()
+        self._buf.seek(0)
+        self._buf.truncate()
 
     def print_header(self, text: str):
-        """Print section header"""
-        print(f"\n{Colors.CYAN}{'=' * 60}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{text}{Colors.RESET}")
-        print(f"{Colors.CYAN}{'=' * 60}{Colors.RESET}\n")
+        """Flush the previous section and buffer the next section header"""
+        self.flush()
+        self.emit(f"\n{Colors.CYAN}{'=' * 60}{Colors.RESET}")
+        self.emit(f"{Colors.BOLD}{Colors.CYAN}{text}{Colors.RESET}")
+        self.emit(f"{Colors.CYAN}{'=' * 60}{Colors.RESET}\n")
 
     def check(self, name: str, passed: bool, message: str = "", is_warning: bool = False):
         """Record and print check result"""
@@ -45,71 +136,95 @@ class HealthChecker:
 
         if passed:
             self.checks_passed += 1
-            status = f"{Colors.GREEN}[OK]{Colors.RESET}"
+            status = self._ok
         elif is_warning:
-            status = f"{Colors.YELLOW}[WARN]{Colors.RESET}"
+            status = self._warn
             self.warnings.append(f"{name}: {message}")
         else:
-            status = f"{Colors.RED}[FAIL]{Colors.RESET}"
+            status = self._fail
             self.errors.append(f"{name}: {message}")
 
-        print(f"{status} {name}")
+        self.emit(f"{status} {name}")
         if message and (self.verbose or not passed):
             indent = "  "
             color = Colors.YELLOW if is_warning else (Colors.GREEN if passed else Colors.RED)
-            print(f"{indent}{color}{message}{Colors.RESET}")
+            self.emit(f"{indent}{color}{message}{Colors.RESET}")
 
-    def run_command(self, cmd: List[str]) -> Tuple[int, str, str]:
-        """Run shell command"""
+    async def run_command_async(self, cmd: List[str]) -> Tuple[int, str, str]:
+        """Run shell command (each distinct command runs at most once per checker)"""
+        key = tuple(cmd)
+        if key not in self._cmd_cache:
+            self._cmd_cache[key] = await self._run_command_async(cmd)
+        return self._cmd_cache[key]
+
+    async def _run_command_async(self, cmd: List[str]) -> Tuple[int, str, str]:
+        """Run shell command without reading from the terminal, bounded by PROBE_TIMEOUT"""
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=project_root,
-                timeout=10
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=project_root
             )
-            return result.returncode, result.stdout, result.stderr
         except Exception as e:
             return 1, "", str(e)
 
-    def check_python_version(self):
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=PROBE_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return 1, "", f"Timed out: {' '.join(cmd)}"
+        return proc.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
+    async def _run_probes(self) -> Dict[str, Tuple[int, str, str]]:
+        """Run every probe command concurrently"""
+        outputs = await asyncio.gather(*(self.run_command_async(cmd) for cmd in PROBE_COMMANDS.values()))
+        return dict(zip(PROBE_COMMANDS, outputs))
+
+    def run_probes(self):
+        """Run all external tool probes at once and cache their (returncode, stdout, stderr)"""
+        self.probes = asyncio.run(self._run_probes())
+
+    def http_session(self):
+        """Return the shared requests session, importing requests on first use"""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                self._session = requests.Session()
+                self._session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+            return self._session
+
+    def check_python_version(self) -> List[CheckResult]:
         """Check Python version"""
-        version = sys.version_info
-        passed = version.major == 3 and version.minor >= 9
-        version_str = f"{version.major}.{version.minor}.{version.micro}"
-
-        self.check(
-            "Python version",
-            passed,
-            f"Found Python {version_str} (requires 3.9+)",
-            is_warning=not passed
-        )
-
-    def check_git_repository(self):
+        return [python_version_result()]
+
+    def check_git_repository(self) -> List[CheckResult]:
         """Check if in git repository"""
-        returncode, _, _ = self.run_command(['git', 'rev-parse', '--git-dir'])
+        returncode, _, _ = self.probes['git_dir']
         passed = returncode == 0
 
         if passed:
-            returncode, branch, _ = self.run_command(['git', 'branch', '--show-current'])
+            returncode, branch, _ = self.probes['git_branch']
             branch_name = branch.strip() if returncode == 0 else "unknown"
-            self.check("Git repository", passed, f"Current branch: {branch_name}")
+            return [result("Git repository", passed, f"Current branch: {branch_name}")]
         else:
-            self.check("Git repository", passed, "Not a git repository")
+            return [result("Git repository", passed, "Not a git repository")]
 
-    def check_database(self):
+    def check_database(self) -> List[CheckResult]:
         """Check database exists and is accessible"""
-        db_path = project_root / "whisper_transcriptions.db"
-
-        if not db_path.exists():
-            self.check("Database file", False, "Database not found (run: python scripts/setup/init_db.py)")
-            return
+        if not DB_PATH.exists():
+            return [result("Database file", False, "Database not found (run: python scripts/setup/init_db.py)")]
 
         # Check if we can connect
         try:
-            with sqlite3.connect(db_path) as conn:
+            # Autocommit, read-only connection: no journal or transaction setup
+            with sqlite3.connect(DB_PATH, isolation_level=None) as conn:
                 cursor = conn.cursor()
+                cursor.execute("PRAGMA query_only=1")
 
                 # Check tables exist
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -119,62 +234,64 @@ class HealthChecker:
                 missing_tables = [t for t in required_tables if t not in tables]
 
                 if missing_tables:
-                    self.check("Database schema", False, f"Missing tables: {', '.join(missing_tables)}")
-                else:
-                    # Count records
-                    cursor.execute("SELECT COUNT(*) FROM audio_files")
-                    audio_count = cursor.fetchone()[0]
-
-                    cursor.execute("SELECT COUNT(*) FROM transcriptions")
-                    trans_count = cursor.fetchone()[0]
-
-                    size_mb = db_path.stat().st_size / (1024 * 1024)
-
-                    self.check(
-                        "Database",
-                        True,
-                        f"{audio_count} audio files, {trans_count} transcriptions ({size_mb:.2f} MB)"
-                    )
+                    return [result("Database schema", False, f"Missing tables: {', '.join(missing_tables)}")]
+
+                # Count records of both tables and read the database size
+                # (page_count * page_size, WAL pages included) in one statement
+                cursor.execute(
+                    "SELECT (SELECT COUNT(*) FROM audio_files), (SELECT COUNT(*) FROM transcriptions),"
+                    " (SELECT page_count FROM pragma_page_count()),"
+                    " (SELECT page_size FROM pragma_page_size())"
+                )
+                audio_count, trans_count, page_count, page_size = cursor.fetchone()
+
+                size_mb = page_count * page_size / (1024 * 1024)
+
+                return [result(
+                    "Database",
+                    True,
+                    f"{audio_count} audio files, {trans_count} transcriptions ({size_mb:.2f} MB)"
+                )]
         except Exception as e:
-            self.check("Database access", False, str(e))
+            return [result("Database access", False, str(e))]
 
-    def check_uploads_directory(self):
+    def check_uploads_directory(self) -> List[CheckResult]:
         """Check uploads directory"""
-        uploads_dir = project_root / "uploads"
-
-        if not uploads_dir.exists():
-            self.check("Uploads directory", False, "Directory does not exist")
-            return
-
-        # Count subdirectories and total files
-        subdirs = list(uploads_dir.glob("*"))
-        audio_files = list(uploads_dir.glob("*/*"))
-
-        total_size_mb = sum(f.stat().st_size for f in audio_files if f.is_file()) / (1024 * 1024)
-
-        self.check(
+        if not UPLOADS_DIR.exists():
+            return [result("Uploads directory", False, "Directory does not exist")]
+
+        # Count subdirectories and total files in one scandir pass
+        # (DirEntry caches the type and stat data readdir already returned)
+        group_count = 0
+        file_count = 0
+        total_size = 0
+        with os.scandir(UPLOADS_DIR) as groups:
+            for group in groups:
+                if not group.is_dir(follow_symlinks=False):
+                    continue
+                group_count += 1
+                with os.scandir(group.path) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            file_count += 1
+                            total_size += entry.stat(follow_symlinks=False).st_size
+
+        total_size_mb = total_size / (1024 * 1024)
+
+        return [result(
             "Uploads directory",
             True,
-            f"{len(subdirs)} groups, {len(audio_files)} files ({total_size_mb:.1f} MB)"
-        )
+            f"{group_count} groups, {file_count} files ({total_size_mb:.1f} MB)"
+        )]
 
-    def check_python_dependencies(self):
+    def check_python_dependencies(self) -> List[CheckResult]:
         """Check Python dependencies"""
-        requirements_file = project_root / "requirements.txt"
-
-        if not requirements_file.exists():
-            self.check("Requirements file", False, "requirements.txt not found")
-            return
+        if not REQS_FILE.exists():
+            return [result("Requirements file", False, "requirements.txt not found")]
 
-        # Check if virtual environment is active
-        in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+        results = []
 
-        self.check(
-            "Virtual environment",
-            in_venv,
-            "Active" if in_venv else "Not activated (recommended to use venv)",
-            is_warning=not in_venv
-        )
+        results.append(virtual_env_result())
 
         # Check key packages
         key_packages = ['fastapi', 'uvicorn', 'sqlalchemy', 'openai-whisper', 'torch']
@@ -188,60 +305,65 @@ class HealthChecker:
             'torch': 'torch'
         }
 
+        # find_spec only locates the module; importing torch/whisper would run their heavy init
         for package in key_packages:
-            try:
-                import_name = package_import_map.get(package, package.replace('-', '_'))
-                __import__(import_name)
-                self.check(f"Package: {package}", True, "Installed")
-            except ImportError:
-                self.check(f"Package: {package}", False, "Not installed")
-
-    def check_node_dependencies(self):
+            import_name = package_import_map.get(package, package.replace('-', '_'))
+            if importlib.util.find_spec(import_name) is not None:
+                results.append(result(f"Package: {package}", True, "Installed"))
+            else:
+                results.append(result(f"Package: {package}", False, "Not installed"))
+
+        return results
+
+    def check_node_dependencies(self) -> List[CheckResult]:
         """Check Node.js and frontend dependencies"""
-        frontend_dir = project_root / "src" / "presentation" / "frontend"
-        node_modules = frontend_dir / "node_modules"
+        results = []
 
         # Check Node.js version
-        returncode, stdout, _ = self.run_command(['node', '--version'])
+        returncode, stdout, _ = self.probes['node']
         if returncode == 0:
             node_version = stdout.strip()
-            self.check("Node.js", True, f"Version {node_version}")
+            results.append(result("Node.js", True, f"Version {node_version}"))
         else:
-            self.check("Node.js", False, "Not installed or not in PATH")
-            return
+            results.append(result("Node.js", False, "Not installed or not in PATH"))
+            return results
 
         # Check npm
-        returncode, stdout, _ = self.run_command(['npm', '--version'])
+        returncode, stdout, _ = self.probes['npm']
         if returncode == 0:
             npm_version = stdout.strip()
-            self.check("npm", True, f"Version {npm_version}")
+            results.append(result("npm", True, f"Version {npm_version}"))
         else:
-            self.check("npm", False, "Not installed")
+            results.append(result("npm", False, "Not installed"))
 
         # Check frontend dependencies
-        if node_modules.exists():
-            # Count installed packages
-            package_count = len(list(node_modules.iterdir()))
-            self.check("Frontend dependencies", True, f"{package_count} packages installed")
+        if NODE_MODULES_DIR.exists():
+            # The package count is only shown in verbose mode
+            if self.verbose:
+                with os.scandir(NODE_MODULES_DIR) as entries:
+                    package_count = sum(1 for _ in entries)
+                message = f"{package_count} packages installed"
+            else:
+                message = "Installed"
+            results.append(result("Frontend dependencies", True, message))
         else:
-            self.check(
+            results.append(result(
                 "Frontend dependencies",
                 False,
                 "Not installed (run: cd src/presentation/frontend && npm install)"
-            )
+            ))
 
-    def check_whisper_models(self):
-        """Check Whisper models in cache"""
-        cache_dir = Path.home() / ".cache" / "whisper"
+        return results
 
-        if not cache_dir.exists():
-            self.check(
+    def check_whisper_models(self) -> List[CheckResult]:
+        """Check Whisper models in cache"""
+        if not WHISPER_CACHE_DIR.exists():
+            return [result(
                 "Whisper cache",
                 False,
                 "No models downloaded (run: python scripts/setup/download_whisper_model.py <model>)",
                 is_warning=True
-            )
-            return
+            )]
 
         # Check for models
         models = {
@@ -253,78 +375,84 @@ class HealthChecker:
             'large-v3-turbo.pt': 'Turbo (809M params)',
         }
 
-        found_models = []
-        for model_file, model_name in models.items():
-            model_path = cache_dir / model_file
-            if model_path.exists():
-                size_mb = model_path.stat().st_size / (1024 * 1024)
-                found_models.append(f"{model_name} ({size_mb:.0f}MB)")
-                if self.verbose:
-                    self.check(f"Model: {model_file}", True, f"{size_mb:.0f} MB")
+        # One directory read instead of an exists() + stat() per model file
+        with os.scandir(WHISPER_CACHE_DIR) as entries:
+            present = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+
+        # One aggregate check regardless of how many models are present
+        found_models = [
+            f"{model_name.split(' (')[0]} ({size / (1024 * 1024):.0f}MB)"
+            for model_file, model_name in models.items()
+            if (size := present.get(model_file)) is not None
+        ]
 
         if found_models:
-            self.check(
+            return [result(
                 "Whisper models",
                 True,
-                f"{len(found_models)} model(s) downloaded: {', '.join([m.split(' (')[0] for m in found_models])}"
-            )
-        else:
-            self.check(
-                "Whisper models",
-                False,
-                "No models found",
-                is_warning=True
-            )
-
-    def check_ffmpeg(self):
+                f"{len(found_models)} model(s) downloaded: {', '.join(found_models)}"
+            )]
+        return [result(
+            "Whisper models",
+            False,
+            "No models found",
+            is_warning=True
+        )]
+
+    def check_ffmpeg(self) -> List[CheckResult]:
         """Check FFmpeg availability"""
         # Check in PATH
-        returncode, stdout, _ = self.run_command(['ffmpeg', '-version'])
+        returncode, stdout, _ = self.probes['ffmpeg']
 
         if returncode == 0:
             version_line = stdout.split('\n')[0] if stdout else "unknown"
-            self.check("FFmpeg", True, version_line)
+            return [result("FFmpeg", True, version_line)]
+
+        # Check in project directory
+        if FFMPEG_DIR.exists():
+            return [result("FFmpeg", True, f"Found in project directory: {FFMPEG_DIR}")]
         else:
-            # Check in project directory
-            ffmpeg_dir = project_root / "ffmpeg-8.0.1-essentials_build" / "bin"
-            if ffmpeg_dir.exists():
-                self.check("FFmpeg", True, f"Found in project directory: {ffmpeg_dir}")
-            else:
-                self.check("FFmpeg", False, "Not found (required for audio processing)")
+            return [result("FFmpeg", False, "Not found (required for audio processing)")]
 
-    def check_backend_server(self):
+    def check_backend_server(self) -> List[CheckResult]:
         """Check if backend server is running"""
+        # Imported here so --help and the other checks don't pay for requests
+        import requests
+
         try:
-            response = requests.get("http://localhost:8001/docs", timeout=2)
+            response = self.http_session().get("http://localhost:8001/docs", timeout=2)
             if response.status_code == 200:
-                self.check("Backend server", True, "Running on http://localhost:8001")
+                return [result("Backend server", True, "Running on http://localhost:8001")]
             else:
-                self.check("Backend server", False, f"Unexpected status: {response.status_code}")
+                return [result("Backend server", False, f"Unexpected status: {response.status_code}")]
         except requests.exceptions.RequestException:
-            self.check(
+            return [result(
                 "Backend server",
                 False,
                 "Not running (start with: python scripts/server/run_backend.py)",
                 is_warning=True
-            )
+            )]
 
-    def check_frontend_server(self):
+    def check_frontend_server(self) -> List[CheckResult]:
         """Check if frontend server is running"""
+        # Imported here so --help and the other checks don't pay for requests
+        import requests
+
         try:
-            response = requests.get("http://localhost:4200", timeout=2)
+            response = self.http_session().get("http://localhost:4200", timeout=2)
             if response.status_code == 200:
-                self.check("Frontend server", True, "Running on http://localhost:4200")
+                return [result("Frontend server", True, "Running on http://localhost:4200")]
             else:
-                self.check("Frontend server", False, f"Unexpected status: {response.status_code}")
+                return [result("Frontend server", False, f"Unexpected status: {response.status_code}")]
         except requests.exceptions.RequestException:
-            self.check(
+            return [result(
                 "Frontend server",
                 False,
                 "Not running (start with: python scripts/server/run_frontend.py)",
                 is_warning=True
-            )
+            )]
 
-    def check_disk_space(self):
+    def check_disk_space(self) -> List[CheckResult]:
         """Check available disk space"""
         try:
             import shutil
@@ -335,40 +463,59 @@ class HealthChecker:
             used_percent = (used / total) * 100
 
             passed = free_gb > 5.0  # At least 5GB free
-            self.check(
+            return [result(
                 "Disk space",
                 passed,
                 f"{free_gb:.1f} GB free of {total_gb:.1f} GB ({used_percent:.1f}% used)",
                 is_warning=not passed
-            )
+            )]
         except Exception as e:
-            self.check("Disk space", False, str(e), is_warning=True)
+            return [result("Disk space", False, str(e), is_warning=True)]
 
     def run_all_checks(self):
         """Run all health checks"""
-        print(f"\n{Colors.BOLD}{Colors.CYAN}System Health Check{Colors.RESET}")
-        print(f"{Colors.BLUE}Project: {project_root}{Colors.RESET}\n")
-
-        self.print_header("1. Environment")
-        self.check_python_version()
-        self.check_git_repository()
-        self.check_disk_space()
-
-        self.print_header("2. Dependencies")
-        self.check_python_dependencies()
-        self.check_node_dependencies()
-        self.check_ffmpeg()
-
-        self.print_header("3. Data & Storage")
-        self.check_database()
-        self.check_uploads_directory()
-
-        self.print_header("4. Whisper Models")
-        self.check_whisper_models()
-
-        self.print_header("5. Servers (Optional)")
-        self.check_backend_server()
-        self.check_frontend_server()
+        self.emit(f"\n{Colors.BOLD}{Colors.CYAN}System Health Check{Colors.RESET}")
+        self.emit(f"{Colors.BLUE}Project: {project_root}{Colors.RESET}\n")
+
+        sections = [
+            ("1. Environment", [
+                self.check_python_version,
+                self.check_git_repository,
+                self.check_disk_space,
+            ]),
+            ("2. Dependencies", [
+                self.check_python_dependencies,
+                self.check_node_dependencies,
+                self.check_ffmpeg,
+            ]),
+            ("3. Data & Storage", [
+                self.check_database,
+                self.check_uploads_directory,
+            ]),
+            ("4. Whisper Models", [
+                self.check_whisper_models,
+            ]),
+            ("5. Servers (Optional)", [
+                self.check_backend_server,
+                self.check_frontend_server,
+            ]),
+        ]
+
+        # Launch git/node/npm/ffmpeg together; the checks read the cached output
+        self.run_probes()
+
+        # Start every check at once so total time is roughly the slowest check;
+        # results are recorded on this thread in section order
+        with ThreadPoolExecutor(max_workers=MAX_CHECK_WORKERS) as pool:
+            pending = [
+                (title, [pool.submit(check_fn) for check_fn in checks])
+                for title, checks in sections
+            ]
+            for title, futures in pending:
+                self.print_header(title)
+                for future in futures:
+                    for check_result in future.result():
+                        self.check(*check_result)
 
         # Summary
         return self.print_summary()
@@ -397,20 +544,21 @@ class HealthChecker:
             status_text = "POOR"
             status_icon = "[FAIL]"
 
-        print(f"{status_color}{Colors.BOLD}{status_icon} System Health: {status_text}{Colors.RESET}")
-        print(f"Checks Passed: {Colors.GREEN}{self.checks_passed}/{self.checks_total}{Colors.RESET} ({pass_rate:.1f}%)")
+        self.emit(f"{status_color}{Colors.BOLD}{status_icon} System Health: {status_text}{Colors.RESET}")
+        self.emit(f"Checks Passed: {Colors.GREEN}{self.checks_passed}/{self.checks_total}{Colors.RESET} ({pass_rate:.1f}%)")
 
         if self.warnings:
-            print(f"\n{Colors.YELLOW}Warnings ({len(self.warnings)}):{Colors.RESET}")
+            self.emit(f"\n{Colors.YELLOW}Warnings ({len(self.warnings)}):{Colors.RESET}")
             for warning in self.warnings:
-                print(f"  ! {warning}")
+                self.emit(f"  ! {warning}")
 
         if self.errors:
-            print(f"\n{Colors.RED}Errors ({len(self.errors)}):{Colors.RESET}")
+            self.emit(f"\n{Colors.RED}Errors ({len(self.errors)}):{Colors.RESET}")
             for error in self.errors:
-                print(f"  X {error}")
+                self.emit(f"  X {error}")
 
-        print(f"\n{Colors.CYAN}{'=' * 60}{Colors.RESET}\n")
+        self.emit(f"\n{Colors.CYAN}{'=' * 60}{Colors.RESET}\n")
+        self.flush()
 
         return pass_rate >= 70  # Success if 70% or more checks pass
 
@@ -1,18 +1,38 @@
 """Show current database contents"""
-import sys
-from pathlib import Path
+from collections import defaultdict
 
 # Add project root to path (scripts/maintenance/ -> scripts/ -> project root)
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
+
+from sqlalchemy import func
 
 from src.infrastructure.persistence.database import SessionLocal
 from src.infrastructure.persistence.models.transcription_model import TranscriptionModel
 from src.infrastructure.persistence.models.audio_file_model import AudioFileModel
 
-db = SessionLocal()
-try:
-    # Get all audio files
-    audio_files = db.query(AudioFileModel).all()
+with SessionLocal() as db:
+    # Only the displayed columns are loaded; the text fields are reduced to
+    # their length / first 50 characters by the database
+    audio_files = db.query(
+        AudioFileModel.id,
+        AudioFileModel.original_filename,
+        AudioFileModel.uploaded_at,
+    ).all()
+    all_trans = db.query(
+        TranscriptionModel.audio_file_id,
+        TranscriptionModel.model,
+        TranscriptionModel.status,
+        TranscriptionModel.enable_llm_enhancement,
+        TranscriptionModel.llm_enhancement_status,
+        TranscriptionModel.llm_processing_time_seconds,
+        func.length(TranscriptionModel.enhanced_text).label('enhanced_length'),
+        func.substr(TranscriptionModel.llm_error_message, 1, 50).label('error_preview'),
+    ).all()
+
+    transcriptions_by_audio = defaultdict(list)
+    for t in all_trans:
+        transcriptions_by_audio[t.audio_file_id].append(t)
+
     print(f'Total audio files: {len(audio_files)}')
 
     if audio_files:
@@ -22,10 +42,7 @@ try:
             print(f'    Filename: {af.original_filename}')
             print(f'    Uploaded: {af.uploaded_at}')
 
-            # Get transcriptions for this audio file
-            transcriptions = db.query(TranscriptionModel).filter(
-                TranscriptionModel.audio_file_id == af.id
-            ).all()
+            transcriptions = transcriptions_by_audio.get(af.id, [])
             print(f'    Transcriptions: {len(transcriptions)}')
             for t in transcriptions:
                 print(f'      * {t.model} - {t.status.value}')
@@ -35,18 +52,14 @@ try:
                     print(f'        LLM: {llm_status}', end='')
                     if t.llm_processing_time_seconds:
                         print(f' ({t.llm_processing_time_seconds:.2f}s)', end='')
-                    if t.enhanced_text:
-                        print(f' - Enhanced text length: {len(t.enhanced_text)}', end='')
-                    if t.llm_error_message:
-                        print(f' - Error: {t.llm_error_message[:50]}...', end='')
+                    if t.enhanced_length:
+                        print(f' - Enhanced text length: {t.enhanced_length}', end='')
+                    if t.error_preview:
+                        print(f' - Error: {t.error_preview}...', end='')
                     print()
             print()
     else:
         print('  (No audio files in database)')
 
     # Check for transcriptions
-    all_trans = db.query(TranscriptionModel).all()
     print(f'\nTotal transcriptions: {len(all_trans)}')
-
-finally:
-    db.close()
@@ -0,0 +1,50 @@
+"""Run the transcriptions column migrations back to back on one connection
+
+Each migration runs in its own SAVEPOINT on the runner's connection, so a
+failing migration is rolled back without undoing the others. On SQLite this
+relies on the driver issuing BEGIN/SAVEPOINT around DDL, which pysqlite's
+default transaction handling does not guarantee.
+
+Run with: python -m scripts.migrations
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path (scripts/migrations/ -> scripts/ -> project root)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.migrations import migrate_add_llm_enhancement, migrate_add_processing_time
+from src.infrastructure.persistence.database import engine
+
+# Migrations that only add columns, in order; each runs in its own SAVEPOINT
+MIGRATIONS = (
+    migrate_add_processing_time,
+    migrate_add_llm_enhancement,
+)
+
+
+def main():
+    # Apply the connection PRAGMAs before the migration transaction opens
+    migrate_add_processing_time.apply_sqlite_pragmas()
+
+    failed = []
+    with engine.begin() as conn:
+        for migration in MIGRATIONS:
+            try:
+                with conn.begin_nested():
+                    applied = migration.upgrade(conn)
+            except Exception:
+                # upgrade() already reported the error; the savepoint is rolled back
+                applied = False
+            if not applied:
+                failed.append(migration.__name__.rsplit(".", 1)[-1])
+            print()
+
+    if failed:
+        print(f"ERROR: {len(failed)} migration(s) failed: {', '.join(failed)}")
+        sys.exit(1)
+    print("All migrations applied.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Schema reflection helpers shared by the migration scripts"""
+from sqlalchemy import inspect
+
+# Reflected column names keyed by (database URL, table name); keying by the
+# URL rather than the bind keeps connections out of the cache
+_table_columns_cache = {}
+
+
+def table_columns(bind, table: str) -> tuple:
+    """
+    Column names of a table, reflected once per database and table.
+
+    Args:
+        bind: Engine or Connection to reflect through
+        table: Table name
+
+    Returns:
+        Column names in table order (empty if the table does not exist).
+        Call clear_table_columns() after altering the table.
+    """
+    key = (str(bind.engine.url), table)
+    if key not in _table_columns_cache:
+        inspector = inspect(bind)
+        if not inspector.has_table(table):
+            return ()
+        _table_columns_cache[key] = tuple(
+            col['name'] for col in inspector.get_columns(table)
+        )
+    return _table_columns_cache[key]
+
+
+def clear_table_columns() -> None:
+    """Drop all cached reflections (call after an ALTER TABLE)"""
+    _table_columns_cache.clear()
@@ -15,70 +15,85 @@ if sys.platform == 'win32':
 # Add project root to path (scripts/migrations/ -> scripts/ -> project root)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from scripts.migrations._schema import table_columns
 from src.infrastructure.persistence.database import engine, SessionLocal
-from sqlalchemy import text, inspect
 
 
-def upgrade():
-    """Add LLM enhancement columns to transcriptions table"""
-    print("Starting migration: Adding LLM enhancement columns...")
+# Columns added by this migration: (name, SQL type, description)
+LLM_COLUMNS = [
+    ("enable_llm_enhancement", "BOOLEAN DEFAULT FALSE NOT NULL", "BOOLEAN, DEFAULT FALSE"),
+    ("enhanced_text", "TEXT", "TEXT"),
+    ("llm_processing_time_seconds", "REAL", "REAL"),
+    ("llm_enhancement_status", "VARCHAR(20)", "VARCHAR(20)"),
+    ("llm_error_message", "TEXT", "TEXT"),
+]
+
+
+def upgrade(conn=None):
+    """
+    Add LLM enhancement columns to transcriptions table
 
-    # Get database inspector to check existing columns
-    inspector = inspect(engine)
+    Args:
+        conn: Existing connection to run on (see scripts/migrations/__main__.py);
+            the migration manages its own transaction when omitted
+
+    Returns:
+        True if the columns are present afterwards, False if the
+        transcriptions table does not exist
+    """
+    print("Starting migration: Adding LLM enhancement columns...")
 
     try:
+        columns = table_columns(engine if conn is None else conn, 'transcriptions')
+
         # Check if the transcriptions table exists
-        if 'transcriptions' not in inspector.get_table_names():
+        if not columns:
             print("ERROR: transcriptions table does not exist!")
             print("Run 'python scripts/setup/init_db.py' first to create tables.")
-            return
-
-        # Check if columns already exist (idempotent migration)
-        columns = [col['name'] for col in inspector.get_columns('transcriptions')]
+            return False
 
-        if 'enable_llm_enhancement' in columns:
+        # Only add the columns that are missing (idempotent migration)
+        existing = set(columns)
+        missing = [column for column in LLM_COLUMNS if column[0] not in existing]
+        if not missing:
             print("WARNING: Columns already exist - migration already applied")
-            return
-
-        with engine.begin() as conn:
-
-            # Add enable_llm_enhancement column
-            print("Adding column: enable_llm_enhancement (BOOLEAN)...")
-            conn.execute(
-                text('ALTER TABLE transcriptions ADD COLUMN enable_llm_enhancement BOOLEAN DEFAULT FALSE NOT NULL')
-            )
-
-            # Add enhanced_text column
-            print("Adding column: enhanced_text (TEXT)...")
-            conn.execute(
-                text('ALTER TABLE transcriptions ADD COLUMN enhanced_text TEXT')
-            )
-
-            # Add llm_processing_time_seconds column
-            print("Adding column: llm_processing_time_seconds (REAL)...")
-            conn.execute(
-                text('ALTER TABLE transcriptions ADD COLUMN llm_processing_time_seconds REAL')
-            )
-
-            # Add llm_enhancement_status column
-            print("Adding column: llm_enhancement_status (VARCHAR)...")
-            conn.execute(
-                text('ALTER TABLE transcriptions ADD COLUMN llm_enhancement_status VARCHAR(20)')
-            )
-
-            # Add llm_error_message column
-            print("Adding column: llm_error_message (TEXT)...")
-            conn.execute(
-                text('ALTER TABLE transcriptions ADD COLUMN llm_error_message TEXT')
-            )
-
-            print("SUCCESS: Migration completed successfully!")
-            print("\nAdded columns:")
-            print("  - enable_llm_enhancement (BOOLEAN, DEFAULT FALSE)")
-            print("  - enhanced_text (TEXT)")
-            print("  - llm_processing_time_seconds (REAL)")
-            print("  - llm_enhancement_status (VARCHAR(20))")
-            print("  - llm_error_message (TEXT)")
+            return True
+
+        for name, _, description in missing:
+            print(f"Adding column: {name} ({description})...")
+
+        # All ALTERs go to the database as one script in one transaction
+        statements = [
+            f"ALTER TABLE transcriptions ADD COLUMN {name} {column_type}"
+            for name, column_type, _ in missing
+        ]
+        if conn is not None:
+            # Stay inside the caller's transaction; pysqlite accepts one
+            # statement per execute(), PostgreSQL takes the whole script
+            if conn.dialect.name == "sqlite":
+                for statement in statements:
+                    conn.exec_driver_sql(statement)
+            else:
+                conn.exec_driver_sql(";\n".join(statements))
+        elif engine.dialect.name == "sqlite":
+            # pysqlite accepts one statement per execute() and runs DDL outside
+            # a transaction, so wrap the script in an explicit BEGIN/COMMIT
+            raw_conn = engine.raw_connection()
+            try:
+                raw_conn.cursor().executescript(
+                    "BEGIN;\n" + ";\n".join(statements) + ";\nCOMMIT;"
+                )
+            finally:
+                raw_conn.close()
+        else:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(";\n".join(statements))
+
+        print("SUCCESS: Migration completed successfully!")
+        print("\nAdded columns:")
+        for name, _, description in missing:
+            print(f"  - {name} ({description})")
+        return True
 
     except Exception as e:
         print(f"ERROR: Migration failed: {str(e)}")
@@ -123,4 +138,4 @@ if __name__ == "__main__":
     if args.downgrade:
         downgrade()
     else:
-        upgrade()
+        sys.exit(0 if upgrade() else 1)
@@ -18,6 +18,16 @@ print(f"Migrating database at: {db_path}")
 conn = sqlite3.connect(db_path)
 cursor = conn.cursor()
 
+# Relaxed sync, larger page cache and mmap so future backfills run fast. These
+# only last for this connection; journal_mode is left alone because WAL would
+# persist in the database file
+cursor.executescript("""
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+""")
+
 try:
     # Check if model column exists
     cursor.execute("PRAGMA table_info(transcriptions)")
@@ -27,13 +37,15 @@ try:
         print("✓ model column already exists!")
     else:
         print("Adding model column to transcriptions table...")
-        cursor.execute("ALTER TABLE transcriptions ADD COLUMN model VARCHAR(50)")
-        conn.commit()
+        # Connection context manager commits on success, rolls back on error
+        with conn:
+            cursor.execute("ALTER TABLE transcriptions ADD COLUMN model VARCHAR(50)")
         print("✓ Successfully added model column!")
 
-    # Verify the column was added
-    cursor.execute("PRAGMA table_info(transcriptions)")
-    columns = [row[1] for row in cursor.fetchall()]
+        # Verify the column was added
+        cursor.execute("PRAGMA table_info(transcriptions)")
+        columns = [row[1] for row in cursor.fetchall()]
+
     print(f"\nCurrent columns in transcriptions table: {', '.join(columns)}")
 
 except Exception as e:
@@ -14,45 +14,80 @@ if sys.platform == 'win32':
 # Add project root to path (scripts/migrations/ -> scripts/ -> project root)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from scripts.migrations._schema import clear_table_columns, table_columns
 from src.infrastructure.persistence.database import engine
-from sqlalchemy import text, inspect
-
-
-def upgrade():
-    """Add processing_time_seconds column to transcriptions table"""
+from sqlalchemy import text
+
+# Relaxed sync, larger page cache and mmap so future backfills run fast. These
+# only last for the connection; journal_mode is left alone because WAL would
+# persist in the database file
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def apply_sqlite_pragmas():
+    """Apply connection PRAGMAs when running against SQLite (no-op for PostgreSQL)"""
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.connect() as conn:
+        for pragma in SQLITE_PRAGMAS:
+            conn.exec_driver_sql(pragma)
+
+
+def upgrade(conn=None):
+    """
+    Add processing_time_seconds column to transcriptions table
+
+    Args:
+        conn: Existing connection to run on (see scripts/migrations/__main__.py);
+            a new transaction is opened when omitted
+
+    Returns:
+        True if the column is present afterwards, False if the
+        transcriptions table does not exist
+    """
     print("Starting migration: Adding processing_time_seconds column...")
 
-    # Get database inspector to check existing columns
-    inspector = inspect(engine)
+    if conn is None:
+        apply_sqlite_pragmas()
+        with engine.begin() as conn:
+            return _upgrade(conn)
+    return _upgrade(conn)
 
+
+def _upgrade(conn):
+    """Reflect and alter the transcriptions table on conn"""
     try:
+        columns = table_columns(conn, 'transcriptions')
+
         # Check if the transcriptions table exists
-        if 'transcriptions' not in inspector.get_table_names():
+        if not columns:
             print("ERROR: transcriptions table does not exist!")
             print("Run 'python scripts/setup/init_db.py' first to create tables.")
-            return
-
-        # Get existing columns
-        columns = [col['name'] for col in inspector.get_columns('transcriptions')]
+            return False
 
         if 'processing_time_seconds' in columns:
             print("✓ processing_time_seconds column already exists - migration already applied")
-            return
+            return True
 
         # Add the column
         print("Adding column: processing_time_seconds (FLOAT)...")
-        with engine.begin() as conn:
-            # Use REAL for SQLite, FLOAT for PostgreSQL (both work with either)
-            conn.execute(
-                text('ALTER TABLE transcriptions ADD COLUMN processing_time_seconds FLOAT')
-            )
+        # Use REAL for SQLite, FLOAT for PostgreSQL (both work with either)
+        conn.execute(
+            text('ALTER TABLE transcriptions ADD COLUMN processing_time_seconds FLOAT')
+        )
 
-        print("✓ SUCCESS: Migration completed successfully!")
+        # Verify the column was added (drop the pre-ALTER reflection first)
+        clear_table_columns()
+        columns = table_columns(conn, 'transcriptions')
 
-        # Verify the column was added
-        inspector = inspect(engine)
-        columns = [col['name'] for col in inspector.get_columns('transcriptions')]
+        print("✓ SUCCESS: Migration completed successfully!")
         print(f"\nCurrent columns in transcriptions table: {', '.join(columns)}")
+        return True
 
     except Exception as e:
         print(f"ERROR: Migration failed: {str(e)}")
@@ -60,4 +95,4 @@ def upgrade():
 
 
 if __name__ == "__main__":
-    upgrade()
+    sys.exit(0 if upgrade() else 1)
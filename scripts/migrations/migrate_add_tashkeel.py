@@ -13,7 +13,7 @@ Database Changes:
     - Type: BOOLEAN, default: FALSE, NOT NULL
 
 Notes:
-    - Safe to run multiple times (checks if column exists)
+    - Safe to run multiple times (an existing column is detected from the ALTER error)
     - Works with both SQLite (local dev) and PostgreSQL (Docker)
     - Existing transcriptions default to enable_tashkeel = FALSE
 """
@@ -24,7 +24,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import create_engine, text, inspect
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.pool import NullPool
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
 # Fix Unicode encoding for Windows console
@@ -32,6 +33,17 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 
+# ALTER statement per SQLAlchemy dialect name, compiled once at import
+ALTERS = {
+    "postgresql": text(
+        "ALTER TABLE transcriptions ADD COLUMN enable_tashkeel BOOLEAN NOT NULL DEFAULT FALSE"
+    ),
+    "sqlite": text(
+        "ALTER TABLE transcriptions ADD COLUMN enable_tashkeel BOOLEAN NOT NULL DEFAULT 0"
+    ),
+}
+
+
 def get_database_url():
     """Get database URL from environment or default to SQLite."""
     import os
@@ -56,11 +68,11 @@ def get_database_url():
     return f"sqlite:///{db_path}"
 
 
-def column_exists(engine, table_name: str, column_name: str) -> bool:
-    """Check if a column exists in a table."""
-    inspector = inspect(engine)
-    columns = [col['name'] for col in inspector.get_columns(table_name)]
-    return column_name in columns
+def is_duplicate_column(error) -> bool:
+    """Check whether an ALTER failed because the column already exists."""
+    message = str(error).lower()
+    # SQLite: "duplicate column name", PostgreSQL: "column ... already exists"
+    return "duplicate column" in message or "already exists" in message
 
 
 def migrate():
@@ -69,41 +81,39 @@ def migrate():
 
     print(f"Database: {database_url.split('@')[-1] if '@' in database_url else database_url}")
 
-    engine = create_engine(database_url)
-
+    # One-shot script: no connection pool, and a single ALTER needs no
+    # BEGIN/COMMIT round-trips around it
+    connect_args = {}
+    if make_url(database_url).get_backend_name() == "postgresql":
+        # Fail fast on an unreachable or hung database
+        connect_args = {"connect_timeout": 5, "options": "-c statement_timeout=30000"}
+    engine = create_engine(
+        database_url,
+        poolclass=NullPool,
+        isolation_level="AUTOCOMMIT",
+        connect_args=connect_args
+    )
+
+    # SQL syntax for the connected database type (SQLite for anything else)
+    sql = ALTERS.get(engine.dialect.name, ALTERS["sqlite"])
+
+    # Attempt the ALTER directly instead of inspecting the schema first;
+    # an existing column is reported by the database as an error
     try:
         with engine.connect() as conn:
-            # Check if column already exists
-            if column_exists(engine, "transcriptions", "enable_tashkeel"):
-                print("✓ Column 'enable_tashkeel' already exists. Migration skipped.")
-                return
-
-            # Determine SQL syntax based on database type
-            if "postgresql" in database_url:
-                # PostgreSQL syntax
-                sql = text("""
-                    ALTER TABLE transcriptions
-                    ADD COLUMN enable_tashkeel BOOLEAN NOT NULL DEFAULT FALSE
-                """)
-            else:
-                # SQLite syntax
-                sql = text("""
-                    ALTER TABLE transcriptions
-                    ADD COLUMN enable_tashkeel BOOLEAN NOT NULL DEFAULT 0
-                """)
-
             conn.execute(sql)
-            conn.commit()
-
-            print("✓ Successfully added 'enable_tashkeel' column to transcriptions table")
-            print("  - Type: BOOLEAN")
-            print("  - Default: FALSE")
-            print("  - Existing records: set to FALSE")
-
     except (OperationalError, ProgrammingError) as e:
+        if is_duplicate_column(e):
+            print("✓ Column 'enable_tashkeel' already exists. Migration skipped.")
+            return
         print(f"✗ Migration failed: {e}")
         sys.exit(1)
 
+    print("✓ Successfully added 'enable_tashkeel' column to transcriptions table")
+    print("  - Type: BOOLEAN")
+    print("  - Default: FALSE")
+    print("  - Existing records: set to FALSE")
+
 
 if __name__ == "__main__":
     print("=" * 60)
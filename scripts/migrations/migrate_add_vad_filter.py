@@ -23,7 +23,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import create_engine, text, inspect
+from scripts.migrations._schema import table_columns
+from sqlalchemy import create_engine, text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
 # Fix Unicode encoding for Windows console
@@ -31,6 +32,17 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 
+# ALTER statement per SQLAlchemy dialect name, compiled once at import
+ALTERS = {
+    "postgresql": text(
+        "ALTER TABLE transcriptions ADD COLUMN vad_filter_used BOOLEAN NOT NULL DEFAULT FALSE"
+    ),
+    "sqlite": text(
+        "ALTER TABLE transcriptions ADD COLUMN vad_filter_used BOOLEAN NOT NULL DEFAULT 0"
+    ),
+}
+
+
 def get_database_url():
     """Get database URL from environment or default to SQLite."""
     import os
@@ -55,11 +67,9 @@ def get_database_url():
     return f"sqlite:///{db_path}"
 
 
-def column_exists(engine, table_name: str, column_name: str) -> bool:
+def column_exists(bind, table_name: str, column_name: str) -> bool:
     """Check if a column exists in a table."""
-    inspector = inspect(engine)
-    columns = [col['name'] for col in inspector.get_columns(table_name)]
-    return column_name in columns
+    return column_name in table_columns(bind, table_name)
 
 
 def migrate():
@@ -73,23 +83,13 @@ def migrate():
     try:
         with engine.connect() as conn:
             # Check if column already exists
-            if column_exists(engine, "transcriptions", "vad_filter_used"):
+            # Reflect on the open connection instead of checking out a second one
+            if column_exists(conn, "transcriptions", "vad_filter_used"):
                 print("✓ Column 'vad_filter_used' already exists. Migration skipped.")
                 return
 
-            # Determine SQL syntax based on database type
-            if "postgresql" in database_url:
-                # PostgreSQL syntax
-                sql = text("""
-                    ALTER TABLE transcriptions
-                    ADD COLUMN vad_filter_used BOOLEAN NOT NULL DEFAULT FALSE
-                """)
-            else:
-                # SQLite syntax
-                sql = text("""
-                    ALTER TABLE transcriptions
-                    ADD COLUMN vad_filter_used BOOLEAN NOT NULL DEFAULT 0
-                """)
+            # SQL syntax for the connected database type (SQLite for anything else)
+            sql = ALTERS.get(engine.dialect.name, ALTERS["sqlite"])
 
             conn.execute(sql)
             conn.commit()
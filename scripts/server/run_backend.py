@@ -4,37 +4,42 @@ import sys
 import os
 from pathlib import Path
 
+# Path(__file__).parent = scripts/server/, .parent.parent = scripts/, .parent.parent.parent = project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 def run_backend():
     """Start the FastAPI backend server with uvicorn"""
     print("=" * 50)
     print("Starting FastAPI Backend Server...")
     print("=" * 50)
 
-    # Get the project root directory
-    # Path(__file__).parent = scripts/server/, .parent.parent = scripts/, .parent.parent.parent = project root
-    project_root = Path(__file__).parent.parent.parent
-
-    print(f"\nProject root: {project_root}")
+    print(f"\nProject root: {PROJECT_ROOT}")
     print("Server: http://0.0.0.0:8001")
     print("API Docs: http://localhost:8001/docs")
     print("Health Check: http://localhost:8001/api/v1/health")
     print("\nPress CTRL+C to stop the server")
     print("-" * 50)
 
+    cmd = [
+        sys.executable,
+        "-m", "uvicorn",
+        "src.presentation.api.main:app",
+        "--host", "0.0.0.0",
+        "--port", "8001",
+        "--reload"
+    ]
+
     try:
-        # Run uvicorn from the project root
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m", "uvicorn",
-                "src.presentation.api.main:app",
-                "--host", "0.0.0.0",
-                "--port", "8001",
-                "--reload"
-            ],
-            cwd=str(project_root)
-        )
-        return result.returncode
+        if sys.platform == 'win32':
+            # exec is unreliable on Windows consoles, so run uvicorn as a child
+            result = subprocess.run(cmd, cwd=str(PROJECT_ROOT))
+            return result.returncode
+
+        # Replace this process with uvicorn: no idle launcher interpreter left
+        # behind, and uvicorn receives CTRL+C directly
+        os.chdir(PROJECT_ROOT)
+        sys.stdout.flush()
+        os.execv(sys.executable, cmd)
     except KeyboardInterrupt:
         print("\n\nBackend server stopped by user")
         return 0
@@ -21,7 +21,7 @@ Usage:
     python scripts/run_dev.py
 
 Features:
-    - Auto-reload on code changes (development mode)
+    - Auto-reload on backend code changes (development mode)
     - Displays startup information (model, device, ports)
     - Loads configuration from .env file
     - Access API docs at http://localhost:{port}/docs
@@ -42,7 +42,7 @@ Exit:
 
 Note:
     Ensure database is initialized first:
-    python scripts/init_db.py
+    python scripts/setup/init_db.py
 """
 import uvicorn
 import sys
@@ -50,10 +50,20 @@ from pathlib import Path
 
 # Add project root to path (scripts/server/ -> scripts/ -> project root)
 # Path(__file__).parent = scripts/server/, .parent.parent = scripts/, .parent.parent.parent = project root
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.infrastructure.config.settings import get_settings
 
+# Backend source trees watched for auto-reload; the frontend tree (with its
+# node_modules) sits under src/presentation and is deliberately left out
+RELOAD_DIRS = [
+    str(PROJECT_ROOT / "src" / "application"),
+    str(PROJECT_ROOT / "src" / "domain"),
+    str(PROJECT_ROOT / "src" / "infrastructure"),
+    str(PROJECT_ROOT / "src" / "presentation" / "api"),
+]
+
 
 if __name__ == "__main__":
     settings = get_settings()
@@ -70,5 +80,6 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=True,
+        reload_dirs=RELOAD_DIRS,
         log_level=settings.log_level.lower()
     )
@@ -1,7 +1,13 @@
 """Script to start the Angular frontend server"""
+import shutil
 import subprocess
 import sys
 import os
+from pathlib import Path
+
+# Path(__file__).parent = scripts/server/, .parent.parent = scripts/, .parent.parent.parent = project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+FRONTEND_DIR = PROJECT_ROOT / "src" / "presentation" / "frontend"
 
 def run_frontend():
     """Start the Angular dev server"""
@@ -9,30 +15,30 @@ def run_frontend():
     print("Starting Angular Frontend Server...")
     print("=" * 50)
 
-    # Change to frontend directory
-    # Get project root: scripts/server/ -> scripts/ -> project root
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    frontend_dir = os.path.join(
-        project_root,
-        "src", "presentation", "frontend"
-    )
+    if not FRONTEND_DIR.exists():
+        print(f"Error: Frontend directory not found: {FRONTEND_DIR}")
+        return 1
 
-    if not os.path.exists(frontend_dir):
-        print(f"Error: Frontend directory not found: {frontend_dir}")
+    # Resolve npm once instead of going through a shell to find it
+    npm = shutil.which("npm")
+    if npm is None:
+        print("Error: npm not found on PATH (install Node.js)")
         return 1
 
-    print(f"\nFrontend directory: {frontend_dir}")
+    print(f"\nFrontend directory: {FRONTEND_DIR}")
     print("Running: npm start")
     print("-" * 50)
 
     try:
-        # Run npm start in the frontend directory
-        result = subprocess.run(
-            ["npm", "start"],
-            cwd=frontend_dir,
-            shell=True
-        )
-        return result.returncode
+        if sys.platform == 'win32':
+            # npm resolves to npm.cmd, which CreateProcess runs without shell=True
+            result = subprocess.run([npm, "start"], cwd=FRONTEND_DIR)
+            return result.returncode
+
+        # Replace this process with npm in the frontend directory
+        os.chdir(FRONTEND_DIR)
+        sys.stdout.flush()
+        os.execv(npm, [npm, "start"])
     except KeyboardInterrupt:
         print("\n\nFrontend server stopped by user")
         return 0
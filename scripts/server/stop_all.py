@@ -1,6 +1,48 @@
 """Enhanced script to stop both backend and frontend servers"""
+import os
 import sys
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Directory of the stop scripts (scripts/server/), independent of the working directory
+SERVER_SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# (output prefix, script) for each server
+STOP_SCRIPTS = (
+    ("BACKEND", "stop_backend.py"),
+    ("FRONTEND", "stop_frontend.py"),
+)
+
+# Serializes lines relayed from the concurrently running stop scripts
+_output_lock = threading.Lock()
+
+def run_stop_script(prefix, script, args, answer):
+    """
+    Run one stop script, relaying each output line as it arrives with a [prefix]
+
+    Returns:
+        Exit code of the script
+    """
+    proc = subprocess.Popen(
+        [sys.executable, str(SERVER_SCRIPTS_DIR / script)] + args,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        # Child prints reach the pipe line by line instead of at exit
+        env={**os.environ, "PYTHONUNBUFFERED": "1"}
+    )
+    if answer:
+        proc.stdin.write(answer)
+    proc.stdin.close()
+
+    for line in proc.stdout:
+        with _output_lock:
+            sys.stdout.write(f"[{prefix}] {line}")
+            sys.stdout.flush()
+    return proc.wait()
 
 def stop_all(force=False):
     """
@@ -12,19 +54,22 @@ def stop_all(force=False):
     print("=" * 60)
     print("Stopping All Servers")
     print("=" * 60)
+    print()
 
     args = ['--force'] if force else []
+    # Force mode was confirmed above; answer the child scripts' own prompt
+    answer = "yes\n" if force else None
 
-    # Stop backend
-    print("\n1. Stopping Backend Server:")
-    backend_result = subprocess.run([sys.executable, "scripts/server/stop_backend.py"] + args)
-
-    # Stop frontend
-    print("\n2. Stopping Frontend Server:")
-    frontend_result = subprocess.run([sys.executable, "scripts/server/stop_frontend.py"] + args)
+    # The stop scripts are independent, so they normally run at the same time.
+    # In force mode stop_backend.py kills every Python process, which would
+    # include a concurrently running stop_frontend.py, so run them in turn
+    with ThreadPoolExecutor(max_workers=1 if force else len(STOP_SCRIPTS)) as pool:
+        backend_code, frontend_code = pool.map(
+            lambda job: run_stop_script(*job, args, answer), STOP_SCRIPTS
+        )
 
     print("\n" + "=" * 60)
-    if backend_result.returncode == 0 or frontend_result.returncode == 0:
+    if backend_code == 0 or frontend_code == 0:
         print("[OK] Server shutdown complete!")
     else:
         print("[WARN] No servers were running")
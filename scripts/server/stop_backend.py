@@ -1,29 +1,158 @@
 """Enhanced script to stop the backend server"""
-import psutil
 import os
 import sys
+import shutil
+import socket
 import time
-import subprocess
 from pathlib import Path
 
+# Path(__file__).parent = scripts/server/, .parent.parent = scripts/, .parent.parent.parent = project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+def port_listening_linux(port):
+    """Check /proc/net/tcp for an IPv4 socket listening on port (Linux only)"""
+    with open('/proc/net/tcp') as f:
+        next(f)  # Header line
+        for line in f:
+            fields = line.split()
+            # fields[1] is "ADDR:PORT" in hex, fields[3] the state (0A = LISTEN)
+            if fields[3] == '0A' and int(fields[1].split(':')[1], 16) == port:
+                return True
+    return False
+
+def port_listening(port):
+    """Cheap stdlib check for a listener on port, used before loading psutil"""
+    if sys.platform.startswith('linux'):
+        return port_listening_linux(port)
+    try:
+        with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
 def check_port_in_use(port):
     """Check if a port is in use"""
-    for conn in psutil.net_connections():
+    # Nothing listening means no PID to look up; skip importing psutil and its socket scan
+    if not port_listening(port):
+        return False, None
+
+    import psutil
+
+    for conn in psutil.net_connections(kind='tcp4'):
         if conn.laddr.port == port and conn.status == 'LISTEN':
             return True, conn.pid
     return False, None
 
+def wait_for_port_free(port, timeout=1.0, interval=0.05):
+    """Poll until nothing listens on port; returns False if still in use after timeout"""
+    deadline = time.monotonic() + timeout
+    while check_port_in_use(port)[0]:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+def is_backend_cmdline(cmdline):
+    """Check whether a command line (list of str or bytes) runs uvicorn for the backend"""
+    args = [arg.decode(errors='replace') if isinstance(arg, bytes) else str(arg) for arg in cmdline]
+    return (any('uvicorn' in arg for arg in args)
+            and any('8001' in arg or 'main:app' in arg for arg in args))
+
+def backend_ancestors(pid):
+    """PIDs of the uvicorn processes above pid, e.g. the --reload supervisor"""
+    import psutil
+
+    pids = []
+    try:
+        for parent in psutil.Process(pid).parents():
+            if not is_backend_cmdline(parent.cmdline()):
+                break
+            pids.append(parent.pid)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+    return pids
+
+def scan_pids_linux(force):
+    """
+    Find backend uvicorn PIDs (and Python PIDs if force) in one pass over /proc
+
+    Reads /proc/<pid>/cmdline directly instead of building psutil Process objects.
+
+    Returns:
+        Tuple of (uvicorn_pids, python_pids)
+    """
+    uvicorn_pids = []
+    python_pids = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                cmdline = f.read().split(b'\x00')
+            if is_backend_cmdline(cmdline):
+                uvicorn_pids.append(int(entry))
+            elif force:
+                with open(f'/proc/{entry}/comm', 'rb') as f:
+                    if f.read().lower().startswith(b'python'):
+                        python_pids.append(int(entry))
+        except OSError:
+            # Process exited or is not readable
+            continue
+    return uvicorn_pids, python_pids
+
+def scan_pids_psutil(force):
+    """
+    Find backend uvicorn PIDs (and Python PIDs if force) in one process_iter pass
+
+    Returns:
+        Tuple of (uvicorn_pids, python_pids)
+    """
+    import psutil
+
+    uvicorn_pids = []
+    python_pids = []
+    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        try:
+            cmdline = proc.info.get('cmdline') or []
+            if is_backend_cmdline(cmdline):
+                uvicorn_pids.append(proc.info['pid'])
+            elif force and (proc.info.get('name') or '').lower().startswith('python'):
+                python_pids.append(proc.info['pid'])
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return uvicorn_pids, python_pids
+
+# Directories that never contain project bytecode; not descended into
+CACHE_SKIP_DIRS = {'.git', 'node_modules', 'dist', '.angular'}
+
+def newest_source_mtime(root, files):
+    """Latest modification time of the .py files in one directory (0 if none)"""
+    return max(
+        (os.stat(os.path.join(root, name)).st_mtime for name in files if name.endswith('.py')),
+        default=0
+    )
+
 def clear_python_cache():
-    """Clear Python __pycache__ directories"""
+    """Clear stale Python __pycache__ directories"""
     try:
-        # Path(__file__).parent = scripts/server/, .parent.parent = scripts/, .parent.parent.parent = project root
-        project_root = Path(__file__).parent.parent.parent
         print("Clearing Python cache...")
 
-        # Use PowerShell to remove all __pycache__ directories
-        cmd = f'powershell -Command "Get-ChildItem -Path \'{project_root}\' -Filter __pycache__ -Recurse -Directory | Remove-Item -Recurse -Force"'
-        subprocess.run(cmd, shell=True, capture_output=True)
-        print("[OK] Python cache cleared")
+        # Walk in-process (no PowerShell launch), pruning the frontend/git trees.
+        # A __pycache__ is only removed when a source file next to it changed
+        # after the cache was last written
+        cleared = 0
+        for root, dirs, files in os.walk(PROJECT_ROOT):
+            if '__pycache__' in dirs:
+                cache_dir = os.path.join(root, '__pycache__')
+                if newest_source_mtime(root, files) > os.stat(cache_dir).st_mtime:
+                    shutil.rmtree(cache_dir, ignore_errors=True)
+                    cleared += 1
+            dirs[:] = [d for d in dirs if d != '__pycache__' and d not in CACHE_SKIP_DIRS]
+
+        if cleared:
+            print(f"[OK] Python cache cleared ({cleared} stale director{'y' if cleared == 1 else 'ies'})")
+        else:
+            print("[OK] Python cache already up to date")
     except Exception as e:
         print(f"[WARN] Could not clear cache: {e}")
 
@@ -45,22 +174,32 @@ def stop_backend(force=False):
     port_in_use, port_pid = check_port_in_use(8001)
     if port_in_use:
         print(f"[OK] Found process using port 8001 (PID: {port_pid})")
-        found_processes.append(port_pid)
+        if port_pid is not None:
+            found_processes.append(port_pid)
+            # A reload worker's supervisor would otherwise keep the port open
+            for pid in backend_ancestors(port_pid):
+                print(f"[OK] Found uvicorn process (PID: {pid})")
+                found_processes.append(pid)
     else:
         print("  No process found using port 8001")
 
     # Method 2: Find by uvicorn command
     print("\n[2/3] Searching for uvicorn processes...")
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            cmdline = proc.info.get('cmdline', [])
-            if cmdline and any('uvicorn' in str(arg) for arg in cmdline):
-                if any('8001' in str(arg) or 'main:app' in str(arg) for arg in cmdline):
-                    if proc.info['pid'] not in found_processes:
-                        print(f"[OK] Found uvicorn process (PID: {proc.info['pid']})")
-                        found_processes.append(proc.info['pid'])
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+    if found_processes and not force:
+        # Located by port: the listener's children are swept when terminating,
+        # so the full process scan is only a fallback
+        print("  Skipped (backend found by port)")
+        uvicorn_pids, python_pids = [], []
+    # One scan serves both the uvicorn search and force mode's Python search
+    elif sys.platform.startswith('linux'):
+        uvicorn_pids, python_pids = scan_pids_linux(force)
+    else:
+        uvicorn_pids, python_pids = scan_pids_psutil(force)
+
+    for pid in uvicorn_pids:
+        if pid not in found_processes:
+            print(f"[OK] Found uvicorn process (PID: {pid})")
+            found_processes.append(pid)
 
     if not found_processes:
         print("  No uvicorn processes found")
@@ -68,19 +207,25 @@ def stop_backend(force=False):
     # Method 3: Force kill ALL Python processes (if requested)
     if force:
         print("\n[WARNING] Force mode enabled - killing ALL Python processes...")
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if proc.info.get('name', '').lower().startswith('python'):
-                    if proc.info['pid'] not in found_processes:
-                        print(f"[OK] Found Python process (PID: {proc.info['pid']})")
-                        found_processes.append(proc.info['pid'])
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        # Never include this script or the stop_all.py that may have launched it
+        own_pids = (os.getpid(), os.getppid())
+        for pid in python_pids:
+            if pid not in found_processes and pid not in own_pids:
+                print(f"[OK] Found Python process (PID: {pid})")
+                found_processes.append(pid)
 
     # Kill all found processes
     if found_processes:
+        import psutil
+
         print(f"\n[3/3] Terminating {len(found_processes)} process(es)...")
         killed = 0
+        # Signal every process tree first, then wait for all of them at once so
+        # the total wait is the slowest shutdown rather than the sum of them
+        to_wait = []
+        # Force mode skips the graceful shutdown: SIGKILL (TerminateProcess on
+        # Windows) right away, so the wait below returns almost immediately
+        stop = psutil.Process.kill if force else psutil.Process.terminate
         for pid in found_processes:
             try:
                 proc = psutil.Process(pid)
@@ -89,35 +234,35 @@ def stop_backend(force=False):
                 children = proc.children(recursive=True)
 
                 # Terminate parent
-                proc.terminate()
+                stop(proc)
 
                 # Terminate children
                 for child in children:
                     try:
-                        child.terminate()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-
-                # Wait for graceful termination
-                gone, alive = psutil.wait_procs([proc] + children, timeout=3)
-
-                # Force kill if still alive
-                for p in alive:
-                    try:
-                        p.kill()
+                        stop(child)
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         pass
 
+                to_wait.append(proc)
+                to_wait.extend(children)
                 print(f"  [OK] Killed PID {pid}")
                 killed += 1
 
             except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
                 print(f"  [WARN] Could not kill PID {pid}: {e}")
 
-        # Verify port is freed
-        time.sleep(1)
-        port_in_use, _ = check_port_in_use(8001)
-        if not port_in_use:
+        # Wait for graceful termination
+        gone, alive = psutil.wait_procs(to_wait, timeout=3)
+
+        # Force kill if still alive
+        for p in alive:
+            try:
+                p.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        # Verify port is freed (returns as soon as the listener is gone)
+        if wait_for_port_free(8001):
             print("\n[OK] Port 8001 is now free")
         else:
             print("\n[WARN] Port 8001 is still in use!")
@@ -11,6 +11,27 @@ def check_port_in_use(port):
             return True, conn.pid
     return False, None
 
+def wait_for_port_free(port, timeout=1.0, interval=0.05):
+    """Poll until nothing listens on port; returns False if still in use after timeout"""
+    deadline = time.monotonic() + timeout
+    while check_port_in_use(port)[0]:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+def node_ancestors(pid):
+    """PIDs of the Node processes directly above pid (e.g. the ng serve parent)"""
+    pids = []
+    try:
+        for parent in psutil.Process(pid).parents():
+            if not parent.name().lower().startswith('node'):
+                break
+            pids.append(parent.pid)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+    return pids
+
 def stop_frontend(force=False):
     """
     Stop the Angular dev server running on port 4200
@@ -29,26 +50,36 @@ def stop_frontend(force=False):
     port_in_use, port_pid = check_port_in_use(4200)
     if port_in_use:
         print(f"[OK] Found process using port 4200 (PID: {port_pid})")
-        found_processes.append(port_pid)
+        if port_pid is not None:
+            found_processes.append(port_pid)
+            for pid in node_ancestors(port_pid):
+                print(f"[OK] Found ng serve process (PID: {pid})")
+                found_processes.append(pid)
     else:
         print("  No process found using port 4200")
 
-    # Method 2: Find by Node + ng command
+    # Method 2: Find by Node + ng command (only needed when the port lookup
+    # found nothing; the listener's children are swept when terminating)
     print("\n[2/3] Searching for Node/ng serve processes...")
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            cmdline = proc.info.get('cmdline', [])
-            name = proc.info.get('name', '').lower()
-
-            # Check if it's a Node process
-            if name.startswith('node') and cmdline:
-                # Check if it's related to Angular (ng serve) or port 4200
-                if any('ng' in str(arg) or '4200' in str(arg) or 'angular' in str(arg).lower() for arg in cmdline):
-                    if proc.info['pid'] not in found_processes:
-                        print(f"[OK] Found ng serve process (PID: {proc.info['pid']})")
-                        found_processes.append(proc.info['pid'])
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+    if found_processes:
+        print("  Skipped (frontend found by port)")
+    else:
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                name = (proc.info.get('name') or '').lower()
+
+                # Check if it's a Node process; only those need their command line read
+                if not name.startswith('node'):
+                    continue
+                cmdline = proc.cmdline()
+                if cmdline:
+                    # Check if it's related to Angular (ng serve) or port 4200
+                    if any('ng' in str(arg) or '4200' in str(arg) or 'angular' in str(arg).lower() for arg in cmdline):
+                        if proc.info['pid'] not in found_processes:
+                            print(f"[OK] Found ng serve process (PID: {proc.info['pid']})")
+                            found_processes.append(proc.info['pid'])
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
 
     if not found_processes:
         print("  No ng serve processes found")
@@ -103,10 +134,8 @@ def stop_frontend(force=False):
             except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
                 print(f"  [WARN] Could not kill PID {pid}: {e}")
 
-        # Verify port is freed
-        time.sleep(1)
-        port_in_use, _ = check_port_in_use(4200)
-        if not port_in_use:
+        # Verify port is freed (returns as soon as the listener is gone)
+        if wait_for_port_free(4200):
             print("\n[OK] Port 4200 is now free")
         else:
             print("\n[WARN] Port 4200 is still in use!")
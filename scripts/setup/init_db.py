@@ -15,12 +15,18 @@ Tables Created:
         duration_seconds, created_at, completed_at, error_message,
         processing_time_seconds
 
+Indexes Created:
+    - ix_transcriptions_audio_file_id_covering: (audio_file_id, id, model, status)
+      on transcriptions, so per-audio-file lookups and orphan checks in the
+      maintenance scripts are served from the index alone. Also added to
+      existing databases.
+
 Database Location:
     - Default: ./whisper_transcriptions.db (project root)
     - Configurable via DATABASE_URL environment variable
 
 Usage:
-    python scripts/init_db.py
+    python scripts/setup/init_db.py
 
 Exit Codes:
     0: Success - Database initialized or already exists
@@ -28,7 +34,7 @@ Exit Codes:
 
 Examples:
     # Initialize database with default settings
-    python scripts/init_db.py
+    python scripts/setup/init_db.py
 
     # Database will be created if it doesn't exist
     # Existing data will NOT be deleted
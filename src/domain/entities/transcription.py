@@ -219,3 +219,22 @@ class Transcription:
     def is_llm_enhanced(self) -> bool:
         """Check if transcription has been enhanced with LLM successfully"""
         return self.llm_enhancement_status == 'completed' and self.enhanced_text is not None
+
+
+@dataclass(frozen=True)
+class TranscriptionSummary:
+    """
+    Read-only summary of a transcription for listings and diagnostics.
+
+    Carries the transcription's identity, status and LLM enhancement state,
+    with the enhanced text reduced to its length.
+    """
+    id: str
+    audio_file_id: str
+    model: Optional[str]
+    status: TranscriptionStatus
+    enable_llm_enhancement: bool
+    llm_enhancement_status: Optional[str]
+    llm_processing_time_seconds: Optional[float]
+    enhanced_text_length: Optional[int]
+    llm_error_message: Optional[str]
@@ -1,6 +1,6 @@
 """Audio file repository interface - Domain layer contract"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..entities.audio_file import AudioFile
 
 
@@ -41,6 +41,19 @@ class AudioFileRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, audio_file_ids: List[str]) -> Dict[str, AudioFile]:
+        """
+        Retrieve multiple audio files by ID in a single lookup.
+
+        Args:
+            audio_file_ids: Unique identifiers of the audio files
+
+        Returns:
+            Dictionary mapping audio file ID to entity (missing IDs are omitted)
+        """
+        pass
+
     @abstractmethod
     async def get_all(
         self,
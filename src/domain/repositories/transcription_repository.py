@@ -1,7 +1,7 @@
 """Transcription repository interface - Domain layer contract"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..entities.transcription import Transcription
+from typing import AsyncIterator, List, Optional
+from ..entities.transcription import Transcription, TranscriptionSummary
 
 
 class TranscriptionRepository(ABC):
@@ -60,6 +60,27 @@ class TranscriptionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def stream_summaries(
+        self,
+        limit: Optional[int] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[TranscriptionSummary]:
+        """
+        Stream transcription summaries, newest first.
+
+        Args:
+            limit: Maximum number of summaries to yield (None for all)
+            batch_size: Number of rows fetched from storage per batch
+
+        Yields:
+            Transcription summaries
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
     @abstractmethod
     async def update(self, transcription: Transcription) -> Transcription:
         """
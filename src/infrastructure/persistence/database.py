@@ -1,5 +1,5 @@
 """Database configuration and session management using SQLAlchemy"""
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
@@ -41,6 +41,12 @@ SessionLocal = sessionmaker(
 # Base class for declarative models
 Base = declarative_base()
 
+# Indexes that earlier schema versions created and newer indexes replace
+SUPERSEDED_INDEXES = (
+    # audio_file_id lookups use ix_transcriptions_audio_file_id_covering
+    "ix_transcriptions_audio_file_id",
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -66,10 +72,12 @@ def get_db() -> Generator[Session, None, None]:
 
 def init_db() -> None:
     """
-    Initialize database by creating all tables.
+    Initialize database by creating all tables and indexes.
 
     This function should be called on application startup
-    to ensure all tables exist.
+    to ensure all tables exist. Indexes added to existing
+    tables after they were created are created as well, and
+    superseded indexes are dropped so inserts stop maintaining them.
     """
     # Import all models here to ensure they're registered with Base
     from .models import transcription_model, audio_file_model
@@ -77,6 +85,15 @@ def init_db() -> None:
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips tables that already exist, so add any missing indexes
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    with engine.begin() as conn:
+        for name in SUPERSEDED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
 
 def drop_db() -> None:
     """
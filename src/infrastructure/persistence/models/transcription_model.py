@@ -1,5 +1,5 @@
 """SQLAlchemy model for Transcription entity"""
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Enum, Text, Boolean
+from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Enum, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -21,13 +21,20 @@ class TranscriptionModel(Base):
     Maps to the 'transcriptions' table in the database.
     """
     __tablename__ = "transcriptions"
+    __table_args__ = (
+        # Covers per-audio-file lookups and the orphan anti-join as index-only scans
+        Index(
+            "ix_transcriptions_audio_file_id_covering",
+            "audio_file_id", "id", "model", "status"
+        ),
+    )
 
     id = Column(String, primary_key=True, index=True)
     audio_file_id = Column(
         String,
         ForeignKey("audio_files.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
+        # Indexed by the leading column of ix_transcriptions_audio_file_id_covering
     )
     text = Column(Text, nullable=True)
     status = Column(
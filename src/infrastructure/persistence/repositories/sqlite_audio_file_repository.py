@@ -1,5 +1,5 @@
 """SQLite implementation of AudioFileRepository"""
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -87,6 +87,18 @@ class SQLiteAudioFileRepository(AudioFileRepository):
         except SQLAlchemyError as e:
             raise RepositoryException(f"Failed to retrieve audio file: {str(e)}")
 
+    async def get_by_ids(self, audio_file_ids: List[str]) -> Dict[str, AudioFile]:
+        """Retrieve multiple audio files by ID with a single IN query"""
+        if not audio_file_ids:
+            return {}
+        try:
+            models = self.db.query(AudioFileModel).filter(
+                AudioFileModel.id.in_(audio_file_ids)
+            ).all()
+            return {model.id: self._to_entity(model) for model in models}
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Failed to retrieve audio files: {str(e)}")
+
     async def get_all(
         self,
         limit: int = 100,
@@ -1,10 +1,15 @@
 """SQLite implementation of TranscriptionRepository"""
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from ....domain.repositories.transcription_repository import TranscriptionRepository
-from ....domain.entities.transcription import Transcription, TranscriptionStatus
+from ....domain.entities.transcription import (
+    Transcription,
+    TranscriptionStatus,
+    TranscriptionSummary,
+)
 from ....domain.exceptions.domain_exception import RepositoryException
 from ..models.transcription_model import TranscriptionModel, TranscriptionStatusEnum
 
@@ -131,6 +136,53 @@ class SQLiteTranscriptionRepository(TranscriptionRepository):
         except SQLAlchemyError as e:
             raise RepositoryException(f"Failed to retrieve transcriptions: {str(e)}")
 
+    async def stream_summaries(
+        self,
+        limit: Optional[int] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[TranscriptionSummary]:
+        """
+        Stream lightweight transcription summaries for diagnostics, newest first.
+
+        Selects only summary columns (enhanced text is reduced to its length)
+        and fetches them in batches, so no ORM objects or full entities are built.
+
+        Args:
+            limit: Maximum number of rows to yield (None for all)
+            batch_size: Number of rows fetched from the cursor per batch
+
+        Yields:
+            TranscriptionSummary for each row
+        """
+        query = self.db.query(
+            TranscriptionModel.id,
+            TranscriptionModel.audio_file_id,
+            TranscriptionModel.model,
+            TranscriptionModel.status,
+            TranscriptionModel.enable_llm_enhancement,
+            TranscriptionModel.llm_enhancement_status,
+            TranscriptionModel.llm_processing_time_seconds,
+            func.length(TranscriptionModel.enhanced_text).label("enhanced_text_length"),
+            TranscriptionModel.llm_error_message
+        ).order_by(TranscriptionModel.created_at.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        try:
+            for row in query.yield_per(batch_size):
+                yield TranscriptionSummary(
+                    id=row.id,
+                    audio_file_id=row.audio_file_id,
+                    model=row.model,
+                    status=TranscriptionStatus(row.status.value),
+                    enable_llm_enhancement=row.enable_llm_enhancement,
+                    llm_enhancement_status=row.llm_enhancement_status,
+                    llm_processing_time_seconds=row.llm_processing_time_seconds,
+                    enhanced_text_length=row.enhanced_text_length,
+                    llm_error_message=row.llm_error_message
+                )
+        except SQLAlchemyError as e:
+            raise RepositoryException(f"Failed to stream transcriptions: {str(e)}")
+
     async def update(self, transcription: Transcription) -> Transcription:
         """Update existing transcription"""
         try: